@@ -1,12 +1,28 @@
 from __future__ import annotations
 
 import random
-from typing import Tuple
+from typing import Callable, Optional, Tuple
 
 from units import Unit
 
 
-def resolve_attack(attacker: Unit, defender: Unit, attacker_hit: float = 0.55, defender_hit: float = 0.50) -> Tuple[bool, bool]:
+# Shared generator: seeding a fresh Random() per battle pulls from OS entropy every time
+_RNG = random.Random()
+
+
+def _combat_core(attacker_hp: int, defender_hp: int, attacker_hit: float, defender_hit: float, roll: Callable[[], float]) -> Tuple[int, int]:
+    # Exchange blows on plain ints until one side drops; returns (attacker_hp, defender_hp)
+    while attacker_hp > 0 and defender_hp > 0:
+        if roll() < attacker_hit:
+            defender_hp -= 3
+        if defender_hp <= 0:
+            break
+        if roll() < defender_hit:
+            attacker_hp -= 2
+    return attacker_hp, defender_hp
+
+
+def resolve_attack(attacker: Unit, defender: Unit, attacker_hit: float = 0.55, defender_hit: float = 0.50, rng: Optional[random.Random] = None) -> Tuple[bool, bool]:
     """
     Minimal probabilistic combat model.
     Returns (attacker_alive, defender_alive).
@@ -14,22 +30,15 @@ def resolve_attack(attacker: Unit, defender: Unit, attacker_hit: float = 0.55, d
     Notes:
     - Placeholder logic inspired by dice-roll loops mentioned in classic Empire.
     - To be expanded in Sprint 4 with matchup tables and city conquest rules.
+    - Pass a seeded rng for reproducible battles; defaults to a shared module generator.
     """
-    rng = random.Random()
+    roll = (rng or _RNG).random
 
     # Hit chances can be modified by caller (e.g., city defense bonus)
     attacker_hit = max(0.20, min(0.80, attacker_hit))
     defender_hit = max(0.20, min(0.80, defender_hit))
 
     # Simple exchange of blows until one drops
-    while attacker.hp > 0 and defender.hp > 0:
-        if rng.random() < attacker_hit:
-            defender.hp -= 3
-        if defender.hp <= 0:
-            break
-        if rng.random() < defender_hit:
-            attacker.hp -= 2
+    attacker.hp, defender.hp = _combat_core(attacker.hp, defender.hp, attacker_hit, defender_hit, roll)
 
     return attacker.hp > 0, defender.hp > 0
-
-
@@ -28,7 +28,10 @@ from __future__ import annotations
 
 import sys
 import time
-from typing import Dict, List, Optional, Tuple
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 import os
 
 try:
@@ -38,11 +41,11 @@ except Exception:
     curses = None  # type: ignore
     HAS_CURSES = False
 
-from map import GameMap, City
+from map import GameMap, City, Terrain
 from units import Army, Unit, Fighter, Carrier, NuclearMissile
 from player import Player
 from combat import resolve_attack
-from savegame import save_full_game, load_full_game
+from savegame import save_full_game, load_full_game, decode_explored
 
 
 Viewport = Tuple[int, int, int, int]  # x, y, width, height
@@ -51,49 +54,220 @@ Viewport = Tuple[int, int, int, int]  # x, y, width, height
 UNIT_SIGHT = 3
 CITY_SIGHT = 5
 
+# Curses key code -> (dx, dy) for moving the selected unit: arrows (plus their
+# keypad/shifted aliases), number keys 8/2/4/6, and numpad diagonals.
+# Key names missing from this curses build are skipped; earlier groups win on clashes.
+MOVE_KEYS: Dict[int, Tuple[int, int]] = {}
+if HAS_CURSES:
+    for _names, _delta in (
+        (("KEY_UP", "KEY_A2", "KEY_SR", "KEY_BTAB", "KEY_SUP", "KEY_NUMPAD8"), (0, -1)),
+        (("KEY_DOWN", "KEY_C2", "KEY_SF", "KEY_SDOWN", "KEY_NUMPAD2"), (0, 1)),
+        (("KEY_LEFT", "KEY_B1", "KEY_SLEFT", "KEY_NUMPAD4"), (-1, 0)),
+        (("KEY_RIGHT", "KEY_B3", "KEY_SRIGHT", "KEY_NUMPAD6"), (1, 0)),
+        (("KEY_A1", "KEY_HOME"), (-1, -1)),
+        (("KEY_A3", "KEY_PPAGE"), (1, -1)),
+        (("KEY_C1", "KEY_END"), (-1, 1)),
+        (("KEY_C3", "KEY_NPAGE"), (1, 1)),
+    ):
+        for _name in _names:
+            _code = getattr(curses, _name, None)
+            if _code is not None:
+                MOVE_KEYS.setdefault(_code, _delta)
+    # Number keys 8/2/4/6 for movement (NumLock on)
+    for _ch, _delta in (('8', (0, -1)), ('2', (0, 1)), ('4', (-1, 0)), ('6', (1, 0))):
+        MOVE_KEYS.setdefault(ord(_ch), _delta)
+
 
 # --- Session statistics (kills/losses by type) ---
 GAME_STATS: Dict[str, Dict[str, Dict[str, int]]] = {}
+# Unit class -> stats/report name, so hot paths skip type(u).__name__. Classes not
+# listed here (e.g. Destroyer) fall back to their __name__ at every lookup
+_TYPE_NAME: Dict[type, str] = {Army: "Army", Fighter: "Fighter", Carrier: "Carrier", NuclearMissile: "NuclearMissile"}
+# Saved "unit_type" name -> class, for rehydrating units on load (unknown names load as Army)
+UNIT_CTORS: Dict[str, type] = {name: cls for cls, name in _TYPE_NAME.items()}
 # Simple ring buffer for recent battle reports (latest last)
-BATTLE_REPORTS: List[str] = []
 MAX_REPORTS: int = 12
+BATTLE_REPORTS: Deque[str] = deque(maxlen=MAX_REPORTS)
+# Bumped whenever GAME_STATS or BATTLE_REPORTS change; keys the build_stats_lines cache
+STATS_VERSION: int = 0
+_stats_cache: Optional[Tuple[Tuple[int, str, Optional[int]], List[str]]] = None
+
+
+# --- Per-player unit rosters (spawn order) for next-unit selection ---
+PLAYER_UNITS: Dict[str, List[Unit]] = {}
+# id(unit) -> position of that unit in its owner's PLAYER_UNITS list
+UNIT_INDEX_IN_PLAYER: Dict[int, int] = {}
+# Live missiles of both players in spawn order (same order as the units list),
+# so end-of-turn auto-detonation does not scan every unit
+LIVE_MISSILES: List[NuclearMissile] = []
+# Coarse spatial index over live units: (x >> UNIT_CELL_SHIFT, y >> UNIT_CELL_SHIFT)
+# -> units in that 16x16 cell, in registration order. Kept in step by
+# _register_unit, kill_unit and move_unit; serves blast-radius queries.
+UNIT_CELL_SHIFT = 4
+UNIT_BUCKETS: Dict[Tuple[int, int], List[Unit]] = {}
+# Exact position index over live units: (x, y) -> units standing there (moves only
+# enter empty tiles, so normally one). Maintained alongside UNIT_BUCKETS; serves unit_at.
+UNIT_TILES: Dict[Tuple[int, int], List[Unit]] = {}
+# Bumped whenever a live unit appears, dies or moves; with GameMap.fow_version it
+# keys the render_view cache
+UNITS_VERSION: int = 0
+_render_cache: Optional[Tuple[tuple, List[str]]] = None
+# Owners whose units were added or killed since their last recompute_visibility;
+# their seer counts are stale, so the next move does a full recompute
+_VIS_STALE: set = set()
+
+
+def _stats_changed() -> None:
+    global STATS_VERSION
+    STATS_VERSION += 1
+
+
+def _bump_forces(u: Unit, delta: int) -> None:
+    forces = GAME_STATS.get(u.owner, {}).get("forces")
+    nm = _TYPE_NAME.get(type(u))
+    if forces is not None and nm in forces:
+        forces[nm] += delta
+        _stats_changed()
+
+
+def _units_changed() -> None:
+    global UNITS_VERSION
+    UNITS_VERSION += 1
+
+
+def _register_unit(u: Unit) -> None:
+    _units_changed()
+    roster = PLAYER_UNITS.setdefault(u.owner, [])
+    UNIT_INDEX_IN_PLAYER[id(u)] = len(roster)
+    roster.append(u)
+    if isinstance(u, NuclearMissile):
+        LIVE_MISSILES.append(u)
+    UNIT_BUCKETS.setdefault((u.x >> UNIT_CELL_SHIFT, u.y >> UNIT_CELL_SHIFT), []).append(u)
+    UNIT_TILES.setdefault((u.x, u.y), []).append(u)
+    _VIS_STALE.add(u.owner)
+    _bump_forces(u, 1)
+
+
+def add_unit(units: List[Unit], u: Unit) -> None:
+    units.append(u)
+    _register_unit(u)
+
+
+def _drop_from(index: Dict[Tuple[int, int], List[Unit]], key: Tuple[int, int], u: Unit) -> None:
+    # Remove u (by identity) from index[key], deleting the entry once it is empty
+    bucket = index.get(key)
+    if bucket is None:
+        return
+    for j, v in enumerate(bucket):
+        if v is u:
+            del bucket[j]
+            break
+    if not bucket:
+        del index[key]
+
+
+def _unbucket(u: Unit) -> None:
+    _drop_from(UNIT_BUCKETS, (u.x >> UNIT_CELL_SHIFT, u.y >> UNIT_CELL_SHIFT), u)
+    _drop_from(UNIT_TILES, (u.x, u.y), u)
+
+
+def move_unit(u: Unit, nx: int, ny: int) -> None:
+    """Put a live unit on (nx, ny), moving it between spatial indexes as needed."""
+    s = UNIT_CELL_SHIFT
+    if (u.x >> s, u.y >> s) != (nx >> s, ny >> s):
+        _drop_from(UNIT_BUCKETS, (u.x >> s, u.y >> s), u)
+        UNIT_BUCKETS.setdefault((nx >> s, ny >> s), []).append(u)
+    _drop_from(UNIT_TILES, (u.x, u.y), u)
+    UNIT_TILES.setdefault((nx, ny), []).append(u)
+    u.x, u.y = nx, ny
+    _units_changed()
+
+
+def kill_unit(u: Unit) -> None:
+    """Mark a unit dead and drop it from its owner's roster and force count."""
+    u.hp = 0
+    roster = PLAYER_UNITS.get(u.owner)
+    idx = UNIT_INDEX_IN_PLAYER.pop(id(u), -1)
+    if roster is None or not (0 <= idx < len(roster)) or roster[idx] is not u:
+        # Already removed (e.g. a missile caught in its own blast)
+        return
+    del roster[idx]
+    _units_changed()
+    for j in range(idx, len(roster)):
+        UNIT_INDEX_IN_PLAYER[id(roster[j])] = j
+    if isinstance(u, NuclearMissile):
+        # By identity: units are dataclasses, so == would match look-alike missiles
+        for j, m in enumerate(LIVE_MISSILES):
+            if m is u:
+                del LIVE_MISSILES[j]
+                break
+    _unbucket(u)
+    _VIS_STALE.add(u.owner)
+    _bump_forces(u, -1)
+
+
+def rebuild_unit_roster(units: List[Unit]) -> None:
+    # Call after the unit list is built or replaced wholesale (new game, load)
+    PLAYER_UNITS.clear()
+    UNIT_INDEX_IN_PLAYER.clear()
+    _units_changed()
+    LIVE_MISSILES.clear()
+    UNIT_BUCKETS.clear()
+    UNIT_TILES.clear()
+    for stats in GAME_STATS.values():
+        forces = stats.get("forces")
+        if forces is not None:
+            for t in forces:
+                forces[t] = 0
+    _stats_changed()
+    for u in units:
+        if u.is_alive():
+            _register_unit(u)
 
 
 def init_game_stats(players: List[str]) -> None:
     global GAME_STATS
     types = ["Army", "Fighter", "Carrier", "NuclearMissile"]
-    GAME_STATS = {p: {"kills": {t: 0 for t in types}, "losses": {t: 0 for t in types}} for p in players}
+    # "forces" counts live units; maintained by _register_unit / kill_unit
+    GAME_STATS = {p: {"kills": {t: 0 for t in types}, "losses": {t: 0 for t in types}, "forces": {t: 0 for t in types}} for p in players}
+    _stats_changed()
 
 
-def record_kill(killer_owner: str, victim: Unit) -> None:
-    vtype = type(victim).__name__
+def record_kill(killer_owner: str, vtype: str) -> None:
     if killer_owner in GAME_STATS and vtype in GAME_STATS[killer_owner]["kills"]:
         GAME_STATS[killer_owner]["kills"][vtype] += 1
+        _stats_changed()
 
 
-def record_loss(owner: str, unit: Unit) -> None:
-    utype = type(unit).__name__
+def record_loss(owner: str, utype: str) -> None:
     if owner in GAME_STATS and utype in GAME_STATS[owner]["losses"]:
         GAME_STATS[owner]["losses"][utype] += 1
+        _stats_changed()
 
 
 def add_battle_report(line: str) -> None:
+    # deque(maxlen=...) drops the oldest entry on overflow
     BATTLE_REPORTS.append(line)
-    if len(BATTLE_REPORTS) > MAX_REPORTS:
-        del BATTLE_REPORTS[0:len(BATTLE_REPORTS) - MAX_REPORTS]
+    _stats_changed()
 
 def build_stats_lines(active_player: str, units: List[Unit], vw: int, world: GameMap, sidebar_w: int, max_cols: Optional[int] = None) -> List[str]:
-    # Only show when full-screen map is visible; caller controls visibility
-    # Compute forces for active player
-    forces: Dict[str, int] = {"Army": 0, "Fighter": 0, "Carrier": 0, "NuclearMissile": 0}
-    for u in units:
-        if u.is_alive() and u.owner == active_player:
-            nm = type(u).__name__
-            if nm in forces:
-                forces[nm] += 1
-    stats = GAME_STATS.get(active_player, {"kills": {}, "losses": {}})
+    # Only show when full-screen map is visible; caller controls visibility.
+    # The result depends only on the stats/reports and the player and width, so
+    # it is reused until STATS_VERSION moves (callers must not modify it).
+    global _stats_cache
+    key = (STATS_VERSION, active_player, max_cols)
+    if _stats_cache is not None and _stats_cache[0] == key:
+        return _stats_cache[1]
+    lines = _format_stats_lines(active_player, max_cols)
+    _stats_cache = (key, lines)
+    return lines
+
+
+def _format_stats_lines(active_player: str, max_cols: Optional[int]) -> List[str]:
+    stats = GAME_STATS.get(active_player, {"kills": {}, "losses": {}, "forces": {}})
     kills = stats.get("kills", {})
     losses = stats.get("losses", {})
+    forces = stats.get("forces", {})
     def fmt_row(label: str, data: Dict[str, int]) -> str:
         return (
             f" {label}: A {data.get('Army', 0)}"
@@ -113,7 +287,7 @@ def build_stats_lines(active_player: str, units: List[Unit], vw: int, world: Gam
         base_lines.append("")
         base_lines.append("Reports:")
         # show most recent first
-        for entry in reversed(BATTLE_REPORTS[-8:]):
+        for entry in islice(reversed(BATTLE_REPORTS), 8):
             base_lines.append(f" {entry}")
     if max_cols is None or max_cols <= 0:
         return base_lines
@@ -142,16 +316,25 @@ def clamp(value: int, low: int, high: int) -> int:
 
 def overlay_units_on_buffer(buffer_lines: List[str], view: Viewport, units: List[Unit]) -> List[str]:
     vx, vy, vw, vh = view
-    # Convert to mutable 2D char array
-    canvas: List[List[str]] = [list(line) for line in buffer_lines]
+    if not buffer_lines:
+        return []
+    # One flat byte canvas for the whole frame, rows joined by newlines; starts[i]
+    # is the offset of row i (rows may be clipped to different widths)
+    buf = bytearray(b"\n".join(line.encode("latin-1") for line in buffer_lines))
+    starts: List[int] = []
+    off = 0
+    for line in buffer_lines:
+        starts.append(off)
+        off += len(line) + 1
+    nrows = len(buffer_lines)
     for u in units:
         if vx <= u.x < vx + vw and vy <= u.y < vy + vh:
             ux, uy = u.x - vx, u.y - vy
-            if 0 <= uy < len(canvas) and 0 <= ux < len(canvas[uy]):
+            if uy < nrows and ux < len(buffer_lines[uy]):
                 # Show unit symbol, case indicates owner (P1 uppercase, P2 lowercase)
                 ch = u.symbol if u.owner == 'P1' else u.symbol.lower()
-                canvas[uy][ux] = ch
-    return ["".join(row) for row in canvas]
+                buf[starts[uy] + ux] = ord(ch)
+    return buf.decode("latin-1").split("\n")
 
 
 def build_initial_game(width: int = 60, height: int = 24) -> Tuple[GameMap, Player, Player, List[Unit]]:
@@ -164,9 +347,9 @@ def build_initial_game(width: int = 60, height: int = 24) -> Tuple[GameMap, Play
 
     # Assign starter cities if available
     if len(world.cities) >= 2:
-        world.cities[0].owner = p1.name
+        world.set_city_owner(world.cities[0], p1.name)
         p1.cities.add((world.cities[0].x, world.cities[0].y))
-        world.cities[-1].owner = p2.name
+        world.set_city_owner(world.cities[-1], p2.name)
         p2.cities.add((world.cities[-1].x, world.cities[-1].y))
 
     # Spawn one army for each player at their city or nearest land tile
@@ -194,52 +377,104 @@ def build_initial_game(width: int = 60, height: int = 24) -> Tuple[GameMap, Play
             c.production_cost = 12
             c.production_progress = 0
 
-    # Initialize session stats for both players
+    # Initialize session stats and unit rosters (forces) for both players
     init_game_stats([p1.name, p2.name])
+    rebuild_unit_roster(units)
     return world, p1, p2, units
 
 
 def render_view(world: GameMap, view: Viewport, units: List[Unit], active_player: Optional[str] = None) -> List[str]:
-    base = world.render(view, active_player=active_player)
+    global _render_cache
     if active_player is None:
-        return overlay_units_on_buffer(base, view, units)
-    # Filter enemy units by visibility
+        return overlay_units_on_buffer(world.render(view), view, units)
+    # Keys that change neither the map, the fog nor any unit (selection, city focus,
+    # production) reuse the previous frame (callers must not modify it)
+    key = (world, world.fow_version, UNITS_VERSION, view, active_player)
+    if _render_cache is not None and _render_cache[0] == key:
+        return _render_cache[1]
+    rows = _render_units(world, view, world.render(view, active_player=active_player), active_player)
+    _render_cache = (key, rows)
+    return rows
+
+
+def _render_units(world: GameMap, view: Viewport, base: List[str], active_player: str) -> List[str]:
+    # Walk the live per-owner rosters (no dead units to skip), deciding glyph case and
+    # whether sight applies once per owner; cull to the viewport, hide enemies outside
+    # the active player's sight, then splice the glyph into its row string
+    vx, vy, _, _ = view
     vis = world.visible.get(active_player)
-    filtered: List[Unit] = []
-    for u in units:
-        if not u.is_alive():
+    w = world.width
+    rows = base
+    nrows = len(rows)
+    for owner, roster in PLAYER_UNITS.items():
+        upper = owner == 'P1'
+        hidden = owner != active_player
+        if hidden and vis is None:
             continue
-        if u.owner == active_player:
-            filtered.append(u)
-        else:
-            if vis is not None and 0 <= u.y < world.height and 0 <= u.x < world.width and vis[u.y][u.x]:
-                filtered.append(u)
-    return overlay_units_on_buffer(base, view, filtered)
+        for u in roster:
+            ux, uy = u.x - vx, u.y - vy
+            # Rows from world.render are already clipped to the viewport and map
+            if not (0 <= uy < nrows and 0 <= ux < len(rows[uy])):
+                continue
+            if hidden and not vis[u.y * w + u.x]:
+                continue
+            ch = u.symbol if upper else u.symbol.lower()
+            row = rows[uy]
+            rows[uy] = row[:ux] + ch + row[ux + 1:]
+    return rows
 
 
 # --- Game helpers for hot-seat ---
 def get_units_for_owner(units: List[Unit], owner: str) -> List[Unit]:
-    return [u for u in units if u.owner == owner and u.is_alive()]
+    # The roster already holds exactly the owner's live units, in spawn order
+    return list(PLAYER_UNITS.get(owner, ()))
 
 
 def unit_at(units: List[Unit], x: int, y: int) -> Optional[Unit]:
-    for u in units:
-        if u.is_alive() and u.x == x and u.y == y:
+    for u in UNIT_TILES.get((x, y), ()):
+        if u.is_alive():
             return u
     return None
 
 
 def city_at(world: GameMap, x: int, y: int) -> Optional[City]:
-    for c in world.cities:
-        if c.x == x and c.y == y:
-            return c
+    return world.city_grid.get((x, y))
+
+
+def has_won(world: GameMap, player: str, opponent: str) -> bool:
+    # Victory: the opponent holds no cities while the player still holds one.
+    # Emptiness of the per-owner lists is all that matters; nothing is counted.
+    return not world.cities_by_owner.get(opponent) and bool(world.cities_by_owner.get(player))
+
+
+def get_own_cities(world: GameMap, player: str) -> List[City]:
+    # The map's live per-owner list, not a copy: read it, don't modify it
+    return world.cities_by_owner.get(player, [])
+
+
+def focused_city_at(world: GameMap, player: str, focused_city_index: Optional[int]) -> Optional[City]:
+    # City picked by the 'c' focus cycle; the index wraps as cities are won or lost
+    if focused_city_index is None:
+        return None
+    own_cities = get_own_cities(world, player)
+    return own_cities[focused_city_index % len(own_cities)] if own_cities else None
+
+
+def resolve_target_city(world: GameMap, player: str, focused_city_index: Optional[int], selected: Optional[Unit]) -> Optional[City]:
+    # Target of the production keys: the focused city if any, else the city under
+    # the selected unit; only ever one of the player's own cities
+    target_city = focused_city_at(world, player, focused_city_index)
+    if target_city is None and selected is not None and selected.owner == player:
+        target_city = city_at(world, selected.x, selected.y)
+    if target_city is not None and target_city.owner == player:
+        return target_city
     return None
 
 
 def is_land(world: GameMap, x: int, y: int) -> bool:
     if not (0 <= x < world.width and 0 <= y < world.height):
         return False
-    return world.tiles[y][x] == '+'
+    return world.tiles[y * world.width + x] == Terrain.LAND_B
 
 
 def can_found_city(world: GameMap, units: List[Unit], u: Unit) -> bool:
@@ -265,11 +500,11 @@ def found_city_from_army(world: GameMap, units: List[Unit], u: Unit) -> bool:
         return False
     # Create city with default production set to Army
     new_city = City(x=u.x, y=u.y, owner=u.owner, production_type='Army', production_progress=0, production_cost=8)
-    world.cities.append(new_city)
+    world.add_city(new_city)
     # Mark on player's city set if tracked
     # Player sets are updated elsewhere in flow; for now we keep map as source of truth
     # Remove (kill) the unit
-    u.hp = 0
+    kill_unit(u)
     return True
 
 
@@ -281,7 +516,7 @@ def try_capture_city(world: GameMap, unit: Unit) -> bool:
     if isinstance(unit, Fighter):
         return False
     if c.owner != unit.owner:
-        c.owner = unit.owner
+        world.set_city_owner(c, unit.owner)
         # auto-set basic production on capture
         c.production_type = 'Army'
         c.production_cost = 8
@@ -290,6 +525,17 @@ def try_capture_city(world: GameMap, unit: Unit) -> bool:
     return False
 
 
+# Base (attacker_hit, defender_hit) by exact unit types; city defense is applied on top.
+# Fighters strike well against everything but Armies (balance tweak).
+DEFAULT_ODDS: Tuple[float, float] = (0.53, 0.52)
+COMBAT_ODDS: Dict[Tuple[type, type], Tuple[float, float]] = {
+    (Fighter, Army): (0.53, 0.47),
+    (Fighter, Fighter): (0.60, 0.40),
+    (Fighter, Carrier): (0.60, 0.40),
+    (Fighter, NuclearMissile): (0.60, 0.40),
+}
+
+
 def try_move_unit(world: GameMap, units: List[Unit], u: Unit, dx: int, dy: int) -> Tuple[bool, bool, bool, str]:
     """
     Returns (moved_or_fought, captured_city, immediate_victory, message)
@@ -305,7 +551,7 @@ def try_move_unit(world: GameMap, units: List[Unit], u: Unit, dx: int, dy: int)
         return False, False, False, ""
     # Carriers must stay on ocean
     if isinstance(u, Carrier):
-        if 0 <= nx < world.width and 0 <= ny < world.height and world.tiles[ny][nx] != '.':
+        if 0 <= nx < world.width and 0 <= ny < world.height and world.tiles[ny * world.width + nx] != Terrain.OCEAN_B:
             return False, False, False, ""
     # Special handling for NuclearMissile straight-line constraint and skipping over blockers
     if isinstance(u, NuclearMissile):
@@ -329,18 +575,18 @@ def try_move_unit(world: GameMap, units: List[Unit], u: Unit, dx: int, dy: int)
             if unit_at(units, nx2, ny2) is not None:
                 return False, False, False, "Missile hop landing occupied"
             # Perform hop
-            u.x, u.y = nx2, ny2
+            move_unit(u, nx2, ny2)
             u.moves_left -= 2
             u.traveled += 2
         else:
             # Normal step
-            u.x, u.y = nx, ny
+            move_unit(u, nx, ny)
             u.moves_left -= 1
             u.traveled += 1
         # Auto-detonate at max distance
         if u.traveled >= 40 or u.moves_left <= 0:
             det_u, det_c = detonate_missile(world, units, u.owner, u.x, u.y, radius=10)
-            u.hp = 0
+            kill_unit(u)
             return True, False, False, f"Missile detonated: units {det_u}, cities {det_c}"
         return True, False, False, ""
 
@@ -354,7 +600,7 @@ def try_move_unit(world: GameMap, units: List[Unit], u: Unit, dx: int, dy: int)
                     if 0 <= nx2 < world.width and 0 <= ny2 < world.height:
                         if unit_at(units, nx2, ny2) is None:
                             # Fighters can land on any terrain; perform hop
-                            u.x, u.y = nx2, ny2
+                            move_unit(u, nx2, ny2)
                             u.moves_left -= 2
                             # Fighters cannot capture; call anyway for consistency (will no-op)
                             _ = try_capture_city(world, u)
@@ -367,20 +613,8 @@ def try_move_unit(world: GameMap, units: List[Unit], u: Unit, dx: int, dy: int)
                     return False, False, False, "Need 2 moves to hop over friendly"
             return False, False, False, ""  # cannot stack for others
         # combat (Carriers have no special attack; use default odds)
-        # Missiles fly over any units; they do not engage in combat
-        if isinstance(u, NuclearMissile):
-            # Allow passing over by treating as if no blocker (handled in missile branch above normally)
-            pass
-        # Base odds; special-case Fighter vs Army per balance tweaks
-        if isinstance(u, Fighter) and isinstance(blocking, Army):
-            a_hit = 0.53
-            d_hit = 0.47
-        elif isinstance(u, Fighter):
-            a_hit = 0.60
-            d_hit = 0.40
-        else:
-            a_hit = 0.53
-            d_hit = 0.52
+        # Missiles never reach here: the missile branch above hops over blockers
+        a_hit, d_hit = COMBAT_ODDS.get((type(u), type(blocking)), DEFAULT_ODDS)
         # City defense bonus increased to ±0.15
         cdef = city_at(world, nx, ny)
         if cdef is not None and cdef.owner == blocking.owner:
@@ -388,44 +622,42 @@ def try_move_unit(world: GameMap, units: List[Unit], u: Unit, dx: int, dy: int)
             d_hit += 0.15
         attacker_alive, defender_alive = resolve_attack(u, blocking, attacker_hit=a_hit, defender_hit=d_hit)
         # Add concise battle report
+        a_name = _TYPE_NAME.get(type(u)) or type(u).__name__
+        d_name = _TYPE_NAME.get(type(blocking)) or type(blocking).__name__
         loc = f"@({nx},{ny})"
-        atk = f"{u.owner} {type(u).__name__}"
-        dfd = f"{blocking.owner} {type(blocking).__name__}"
+        atk = f"{u.owner} {a_name}"
+        dfd = f"{blocking.owner} {d_name}"
         city_tag = " city" if (cdef is not None and cdef.owner == blocking.owner) else ""
         outcome = "kill" if not defender_alive else ("trade" if not attacker_alive else "clash")
         add_battle_report(f"{atk} vs {dfd}{city_tag} {loc} a:{a_hit:.2f} d:{d_hit:.2f} -> {outcome}")
         if not defender_alive:
             # remove defender; move in if attacker alive
-            blocking.hp = 0
+            kill_unit(blocking)
             # record kill/loss
-            record_kill(u.owner, blocking)
-            record_loss(blocking.owner, blocking)
+            record_kill(u.owner, d_name)
+            record_loss(blocking.owner, d_name)
             if attacker_alive:
-                u.x, u.y = nx, ny
+                move_unit(u, nx, ny)
                 u.moves_left -= 1
                 captured = try_capture_city(world, u)
                 if captured:
                     opponent = 'P2' if u.owner == 'P1' else 'P1'
-                    opp_city_count = sum(1 for c in world.cities if c.owner == opponent)
-                    my_city_count = sum(1 for c in world.cities if c.owner == u.owner)
-                    return True, True, (opp_city_count == 0 and my_city_count > 0), "Defender destroyed"
+                    return True, True, has_won(world, u.owner, opponent), "Defender destroyed"
                 return True, False, False, "Defender destroyed"
         else:
             # defender survived; attacker may have died
             if not attacker_alive:
-                u.hp = 0
-                record_loss(u.owner, u)
-                record_kill(blocking.owner, u)
+                kill_unit(u)
+                record_loss(u.owner, a_name)
+                record_kill(blocking.owner, a_name)
         return True, False, False, "Attacker destroyed"
     # Move into empty tile
-    u.x, u.y = nx, ny
+    move_unit(u, nx, ny)
     u.moves_left -= 1
     captured = try_capture_city(world, u)
     if captured:
         opponent = 'P2' if u.owner == 'P1' else 'P1'
-        opp_city_count = sum(1 for c in world.cities if c.owner == opponent)
-        my_city_count = sum(1 for c in world.cities if c.owner == u.owner)
-        return True, True, (opp_city_count == 0 and my_city_count > 0), "City captured"
+        return True, True, has_won(world, u.owner, opponent), "City captured"
     return True, False, False, ""
 
 
@@ -455,7 +687,7 @@ def spawn_army(world: GameMap, units: List[Unit], city: City) -> bool:
                 nu = Army(x=sx, y=sy, owner=city.owner or "")
                 nu.reset_moves()
                 nu.home_city = (city.x, city.y)
-                units.append(nu)
+                add_unit(units, nu)
                 return True
     return False
 
@@ -468,7 +700,7 @@ def spawn_fighter(world: GameMap, units: List[Unit], city: City) -> bool:
             nu = Fighter(x=sx, y=sy, owner=city.owner or "")
             nu.reset_moves()
             nu.home_city = (city.x, city.y)
-            units.append(nu)
+            add_unit(units, nu)
             return True
     return False
 
@@ -481,7 +713,7 @@ def spawn_missile(world: GameMap, units: List[Unit], city: City) -> bool:
             nu = NuclearMissile(x=sx, y=sy, owner=city.owner or "")
             nu.reset_moves()
             nu.home_city = (city.x, city.y)
-            units.append(nu)
+            add_unit(units, nu)
             return True
     return False
 
@@ -493,42 +725,49 @@ def spawn_carrier(world: GameMap, units: List[Unit], city: City) -> bool:
     ]
     for sx, sy in candidates:
         if 0 <= sx < world.width and 0 <= sy < world.height:
-            if world.tiles[sy][sx] == '.' and is_tile_free(world, units, sx, sy):
+            if world.tiles[sy * world.width + sx] == Terrain.OCEAN_B and is_tile_free(world, units, sx, sy):
                 nu = Carrier(x=sx, y=sy, owner=city.owner or "")
                 nu.reset_moves()
                 nu.home_city = (city.x, city.y)
-                units.append(nu)
+                add_unit(units, nu)
                 return True
     return False
 
 
 def detonate_missile(world: GameMap, units: List[Unit], owner: str, x: int, y: int, radius: int = 20) -> Tuple[int, int]:
     r2 = radius * radius
-    # Destroy units in radius and neutralize cities
+    # Destroy units in radius and neutralize cities. Only buckets overlapping the
+    # blast's bounding box can hold victims; the distance test runs as one
+    # comprehension per bucket, and victims are gathered before any kill_unit
+    # since that edits the buckets.
+    sh = UNIT_CELL_SHIFT
+    hit: List[Unit] = []
+    for by in range((y - radius) >> sh, ((y + radius) >> sh) + 1):
+        for bx in range((x - radius) >> sh, ((x + radius) >> sh) + 1):
+            bucket = UNIT_BUCKETS.get((bx, by))
+            if bucket:
+                hit.extend([v for v in bucket if (v.x - x) * (v.x - x) + (v.y - y) * (v.y - y) <= r2])
     units_killed = 0
-    for v in units:
+    for v in hit:
         if not v.is_alive():
             continue
-        dx = v.x - x
-        dy = v.y - y
-        if dx * dx + dy * dy <= r2:
-            if v.owner == owner:
-                record_loss(owner, v)
-            else:
-                record_kill(owner, v)
-                record_loss(v.owner, v)
-            v.hp = 0
-            units_killed += 1
-    cities_neutralized = 0
-    for c in world.cities:
-        dx = c.x - x
-        dy = c.y - y
-        if dx * dx + dy * dy <= r2:
-            if c.owner is not None:
-                c.owner = None
-                cities_neutralized += 1
-            # Keep production settings; ownership neutralized only
-    return units_killed, cities_neutralized
+        vname = _TYPE_NAME.get(type(v)) or type(v).__name__
+        if v.owner == owner:
+            record_loss(owner, vname)
+        else:
+            record_kill(owner, vname)
+            record_loss(v.owner, vname)
+        kill_unit(v)
+        units_killed += 1
+    # Only owned cities can be neutralized, so neutral ones are never distance-tested
+    # (Keep production settings; ownership neutralized only)
+    doomed = [
+        c for o, owned in world.cities_by_owner.items() if o is not None
+        for c in owned if (c.x - x) * (c.x - x) + (c.y - y) * (c.y - y) <= r2
+    ]
+    for c in doomed:
+        world.set_city_owner(c, None)
+    return units_killed, len(doomed)
 
 PRODUCTION_CATALOG: Dict[str, Dict[str, Any]] = {
     "Army": {"cost": 12, "spawn": spawn_army, "label": "Army"},
@@ -560,23 +799,22 @@ def cycle_city_production(city: City) -> None:
 
 def enforce_fighter_basing(world: GameMap, units: List[Unit], owner: str) -> None:
     # Fighters must end turn on a friendly city tile or are destroyed
-    for u in units:
-        if not u.is_alive():
+    roster = PLAYER_UNITS.get(owner, ())
+    # Units never share a tile, so a carrier position set answers "friendly carrier here?"
+    carriers = {(v.x, v.y) for v in roster if isinstance(v, Carrier)}
+    # Copy: kill_unit removes fighters from the roster as we go
+    for u in [v for v in roster if isinstance(v, Fighter)]:
+        c = city_at(world, u.x, u.y)
+        if c is not None and c.owner == owner:
             continue
-        if isinstance(u, Fighter) and u.owner == owner:
-            c = city_at(world, u.x, u.y)
-            if c is not None and c.owner == owner:
-                continue
-            # Allow adjacency to friendly Carrier (orthogonal)
-            adjacent_ok = False
-            for dx, dy in ((1,0),(-1,0),(0,1),(0,-1),(1,1),(-1,-1),(1,-1),(-1,1)):
-                ax, ay = u.x + dx, u.y + dy
-                v = unit_at(units, ax, ay)
-                if v is not None and v.is_alive() and isinstance(v, Carrier) and v.owner == owner:
-                    adjacent_ok = True
-                    break
-            if not adjacent_ok:
-                u.hp = 0
+        # Allow adjacency to friendly Carrier (orthogonal)
+        adjacent_ok = False
+        for dx, dy in ((1,0),(-1,0),(0,1),(0,-1),(1,1),(-1,-1),(1,-1),(-1,1)):
+            if (u.x + dx, u.y + dy) in carriers:
+                adjacent_ok = True
+                break
+        if not adjacent_ok:
+            kill_unit(u)
 
 
 def advance_production_and_spawn(world: GameMap, units: List[Unit]) -> None:
@@ -601,60 +839,97 @@ def advance_production_and_spawn(world: GameMap, units: List[Unit]) -> None:
                 c.production_progress = c.production_cost
 
     # Healing: +1 hp/turn in owned cities (cap at max_hp)
+    city_grid = world.city_grid
     for u in units:
-        if not u.is_alive():
+        if u.hp <= 0:
             continue
-        c = city_at(world, u.x, u.y)
+        c = city_grid.get((u.x, u.y))
         if c is not None and c.owner == u.owner and u.hp < u.max_hp:
-            u.hp = min(u.max_hp, u.hp + 1)
+            # hp < max_hp, so a single step cannot overshoot the cap
+            u.hp += 1
 
 
 def reset_moves_for_owner(units: List[Unit], owner: str) -> None:
-    for u in units:
-        if u.owner == owner and u.is_alive():
-            u.reset_moves()
+    # Same as Unit.reset_moves, inlined: this runs over every unit at each turn start
+    for u in PLAYER_UNITS.get(owner, ()):
+        u.moves_left = u.movement_points
+
+
+def _roster_index(own_units: List[Unit], current: Optional[Unit]) -> int:
+    # Position of a live current unit in the roster, or -1 if it is not there
+    if current is None or not current.is_alive():
+        return -1
+    idx = UNIT_INDEX_IN_PLAYER.get(id(current), -1)
+    if 0 <= idx < len(own_units) and own_units[idx] is current:
+        return idx
+    return -1
 
 
 def select_next_unit(units: List[Unit], owner: str, current: Optional[Unit]) -> Optional[Unit]:
-    own_units = [u for u in units if u.owner == owner and u.is_alive()]
+    own_units = PLAYER_UNITS.get(owner)
     if not own_units:
         return None
-    if current is None or current not in own_units:
-        # find first with moves
+    idx = _roster_index(own_units, current)
+    if idx < 0:
+        # find first with moves, else first live unit
+        first_alive: Optional[Unit] = None
         for u in own_units:
             if u.can_move():
                 return u
-        return own_units[0]
-    # rotate
-    idx = own_units.index(current)
-    for i in range(1, len(own_units) + 1):
-        cand = own_units[(idx + i) % len(own_units)]
+            if first_alive is None and u.is_alive():
+                first_alive = u
+        return first_alive
+    # rotate, stopping at the first unit with moves left
+    n = len(own_units)
+    fallback: Optional[Unit] = None
+    for i in range(1, n + 1):
+        cand = own_units[(idx + i) % n]
         if cand.can_move():
             return cand
-    return own_units[(idx + 1) % len(own_units)]
+        if fallback is None and cand.is_alive():
+            fallback = cand
+    return fallback
 
 
 def select_next_unit_any(units: List[Unit], owner: str, current: Optional[Unit]) -> Optional[Unit]:
-    own_units = [u for u in units if u.owner == owner and u.is_alive()]
+    own_units = PLAYER_UNITS.get(owner)
     if not own_units:
         return None
-    if current is None or current not in own_units:
-        return own_units[0]
-    idx = own_units.index(current)
-    return own_units[(idx + 1) % len(own_units)]
+    idx = _roster_index(own_units, current)
+    n = len(own_units)
+    for i in range(1, n + 1):
+        cand = own_units[(idx + i) % n]
+        if cand.is_alive():
+            return cand
+    return None
+
+
+def sight_radius(u: Unit) -> int:
+    # Fighters provide extended sight
+    return 5 if isinstance(u, Fighter) else UNIT_SIGHT
 
 
 def recompute_visibility(world: GameMap, owner: str, units: List[Unit]) -> None:
-    # Clear and mark for the owner based on cities and units
-    world.clear_visible_for(owner)
-    for c in world.cities:
-        if c.owner == owner:
-            world.mark_visible_circle(owner, c.x, c.y, radius=CITY_SIGHT)
-    for u in units:
-        if u.owner == owner and u.is_alive():
-            # Fighters provide extended sight
-            radius = 5 if isinstance(u, Fighter) else UNIT_SIGHT
-            world.mark_visible_circle(owner, u.x, u.y, radius=radius)
+    # Clear and mark for the owner based on cities and units, rebuilding seer counts
+    world.reset_seers(owner)
+    _VIS_STALE.discard(owner)
+    for c in world.cities_by_owner.get(owner, ()):
+        world.add_seer(owner, c.x, c.y, CITY_SIGHT)
+    for u in PLAYER_UNITS.get(owner, ()):
+        world.add_seer(owner, u.x, u.y, sight_radius(u))
+
+
+def update_visibility_after_move(world: GameMap, owner: str, units: List[Unit], u: Unit, old_xy: Tuple[int, int]) -> None:
+    # Shift u's sight from old_xy to its current tile. Falls back to a full recompute
+    # when the owner's seers changed some other way (units added/killed, cities won/lost).
+    if owner in _VIS_STALE or not world.seers_valid(owner):
+        recompute_visibility(world, owner, units)
+        return
+    if (u.x, u.y) == old_xy:
+        return
+    r = sight_radius(u)
+    world.remove_seer(owner, old_xy[0], old_xy[1], r)
+    world.add_seer(owner, u.x, u.y, r)
 
 
 def build_sidebar_lines(ui: str) -> List[str]:
@@ -669,7 +944,7 @@ def build_sidebar_lines(ui: str) -> List[str]:
             " P  Cycle Production",
             " F  Found City",
             " C  Cycle Cities",
-            " S  Save, O Load",
+            " V  Save, O Load",
             " Space End turn",
             " Q  Quit",
             " D  Detonate Nuclear Missile",
@@ -712,10 +987,66 @@ def build_sidebar_lines(ui: str) -> List[str]:
     return commands + terrain + units_help
 
 
+@lru_cache(maxsize=256)
+def _clamp_pair(vx: int, vy: int, world_w: int, world_h: int, vw: int, vh: int) -> Tuple[int, int]:
+    # Keep a viewport origin inside the world; pure geometry, so memoized
+    return clamp(vx, 0, max(0, world_w - vw)), clamp(vy, 0, max(0, world_h - vh))
+
+
+@lru_cache(maxsize=256)
+def _center(world_w: int, world_h: int, vw: int, vh: int, tx: int, ty: int) -> Tuple[int, int]:
+    return _clamp_pair(tx - vw // 2, ty - vh // 2, world_w, world_h, vw, vh)
+
+
 def center_view_on(world: GameMap, vw: int, vh: int, target_x: int, target_y: int) -> Tuple[int, int]:
-    vx = clamp(target_x - vw // 2, 0, max(0, world.width - vw))
-    vy = clamp(target_y - vh // 2, 0, max(0, world.height - vh))
-    return vx, vy
+    return _center(world.width, world.height, vw, vh, target_x, target_y)
+
+
+def unit_from_dict(ud: Dict[str, Any]) -> Unit:
+    # Rebuild a unit from its serialize_units() record
+    u = UNIT_CTORS.get(ud.get("unit_type", "Army"), Army)(x=ud["x"], y=ud["y"], owner=ud["owner"])
+    u.symbol = ud.get("symbol", u.symbol)
+    u.max_hp = ud.get("max_hp", u.max_hp)
+    u.hp = ud.get("hp", u.hp)
+    u.movement_points = ud.get("movement_points", u.movement_points)
+    u.fuel = ud.get("fuel", None)
+    u.moves_left = ud.get("moves_left", u.movement_points)
+    u.home_city = tuple(ud["home_city"]) if ud.get("home_city") else None
+    return u
+
+
+def restore_game(world: GameMap, units: List[Unit], p1: Player, p2: Player, data: Dict[str, Any],
+                 turn_number: int, current_player: str) -> Tuple[int, str]:
+    """Load a load_full_game() payload into the running game; returns (turn_number, current_player)."""
+    loaded_map = data["map"]
+    world.width = loaded_map["width"]
+    world.height = loaded_map["height"]
+    world.set_tile_rows(loaded_map["tiles"])
+    world.set_fog_rows(loaded_map["fog"])
+    world.cities = [City(**c) for c in loaded_map["cities"]]
+    world.rebuild_city_grid()
+    explored = decode_explored(loaded_map.get("explored", {}), world.width, world.height)
+    # Units
+    units.clear()
+    units.extend(unit_from_dict(ud) for ud in data["units"])
+    rebuild_unit_roster(units)
+    # Players
+    pdat = data.get("players", [])
+    if len(pdat) >= 2:
+        p1.name = pdat[0].get("name", p1.name)
+        p1.is_ai = pdat[0].get("is_ai", False)
+        p1.cities = {tuple(t) for t in pdat[0].get("cities", p1.cities)}
+        p2.name = pdat[1].get("name", p2.name)
+        p2.is_ai = pdat[1].get("is_ai", False)
+        p2.cities = {tuple(t) for t in pdat[1].get("cities", p2.cities)}
+    turn_number = data.get("turn_number", turn_number)
+    current_player = data.get("current_player", current_player)
+    # init_fow hands out fresh zeroed byte grids: put the saved exploration back
+    # before visibility is recomputed on top of it
+    world.init_fow([p1.name, p2.name])
+    world.explored.update(explored)
+    recompute_visibility(world, current_player, units)
+    return turn_number, current_player
 
 
 def ensure_save_dir() -> str:
@@ -723,6 +1054,22 @@ def ensure_save_dir() -> str:
     os.makedirs(save_dir, exist_ok=True)
     return save_dir
 
+
+# (save dir, dir mtime in ns, sorted save names) from the last list_saves() scan
+_saves_cache: Optional[Tuple[str, int, List[str]]] = None
+
+
+def list_saves() -> List[str]:
+    # Sorted save names (without .json); rescans only when the directory changes
+    global _saves_cache
+    save_dir = ensure_save_dir()
+    mtime = os.stat(save_dir).st_mtime_ns
+    if _saves_cache is not None and _saves_cache[0] == save_dir and _saves_cache[1] == mtime:
+        return _saves_cache[2]
+    saves = sorted(fn[:-5] for fn in os.listdir(save_dir) if fn.lower().endswith('.json'))
+    _saves_cache = (save_dir, mtime, saves)
+    return saves
+
 def run_curses(world: GameMap, p1: Player, p2: Player, units: List[Unit]) -> None:
     assert HAS_CURSES and curses is not None
 
@@ -744,6 +1091,8 @@ def run_curses(world: GameMap, p1: Player, p2: Player, units: List[Unit]) -> Non
         # reserve sidebar width
         sidebar_lines = build_sidebar_lines('curses')
         sidebar_w = max(len(line) for line in sidebar_lines) + 1
+        # Sidebar text as drawn after each map row; padded with "" so every map row has an entry
+        sidebar_cells = [" " + line[:sidebar_w - 1] for line in sidebar_lines]
         vw = max(20, min(world.width, max_x - sidebar_w))
         vh = max(10, min(world.height, max_y - 1))
         vx, vy = 0, 0
@@ -763,548 +1112,412 @@ def run_curses(world: GameMap, p1: Player, p2: Player, units: List[Unit]) -> Non
         if selected is not None:
             vx, vy = center_view_on(world, vw, vh, selected.x, selected.y)
 
+        # Current player's cities (world.cities_by_owner keeps them up to date)
+        own_cities: List[City] = []
+        focused_city: Optional[City] = None
+        # What each map row currently shows on screen: (row text, selection column,
+        # focus column). Rows whose signature is unchanged are left alone;
+        # full_redraw wipes the screen after out-of-band drawing (handoff screen,
+        # save listing, load, terminal resize).
+        prev_rows: List[Optional[Tuple[str, int, int]]] = []
+        full_redraw = True
+        last_size = (max_y, max_x)
+        # Map rows need rebuilding; key handlers set this when they change what the
+        # map shows. The status line is redrawn every frame regardless, so keys
+        # that only touch it (declined quit, save, production orders) skip the map.
+        dirty = True
+        # Status line text and the inputs it was built from
+        status = ""
+        status_key: Optional[tuple] = None
+        # One-shot message (save result, nuke summary) shown in place of the status
+        # line for the next frame only; drawing it directly would be wiped by that
+        # frame's status redraw before its doupdate
+        status_msg: Optional[str] = None
+
+        # Bound methods/attributes used every frame, resolved once
+        _addstr = stdscr.addstr
+        # addnstr clips to the view width itself, so lines need no [:vw] copy
+        _addnstr = stdscr.addnstr
+        _chgat = stdscr.chgat
+        # Frames only stage output (noutrefresh); the frame's single doupdate writes
+        # it. _refresh (= noutrefresh + doupdate) is kept for prompts that block on
+        # input right after drawing.
+        _refresh = stdscr.refresh
+        _noutrefresh = stdscr.noutrefresh
+        _doupdate = curses.doupdate
+        _getch = stdscr.getch
+        a_reverse = curses.A_REVERSE
+        a_bold = curses.A_BOLD
+
+        def handle_move(dx: int, dy: int) -> bool:
+            """Step the selected unit by (dx, dy); returns True once the game is won and Q pressed."""
+            nonlocal selected, dirty
+            if selected is None:
+                selected = select_next_unit(units, current_player, selected)
+            if selected is not None and selected.owner == current_player:
+                # Even a blocked move can fight, so always repaint
+                dirty = True
+                old_xy = (selected.x, selected.y)
+                moved, captured, victory, _ = try_move_unit(world, units, selected, dx, dy)
+                if victory:
+                    _addnstr(vh, 0, f"{current_player} wins! Press Q to quit.", vw)
+                    _refresh()
+                    while True:
+                        k2 = _getch()
+                        if k2 in (ord('q'), ord('Q')):
+                            return True
+                if moved:
+                    # update FoW after move
+                    update_visibility_after_move(world, current_player, units, selected, old_xy)
+                    # keep selection if unit still has moves
+                    if not (selected is not None and selected.is_alive() and selected.can_move()):
+                        selected = select_next_unit(units, current_player, selected)
+            return False
+
+        # --- Key handlers: each returns True to leave the game loop ---
+        def on_quit() -> bool:
+            # confirm quit if game in progress
+            _addnstr(vh, 0, "Quit? (y/N)", vw)
+            _refresh()
+            k2 = _getch()
+            return k2 in (ord('y'), ord('Y'))
+
+        def pan(dx: int, dy: int) -> bool:
+            nonlocal vx, vy, dirty
+            nx = clamp(vx + dx, 0, max(0, world.width - vw))
+            ny = clamp(vy + dy, 0, max(0, world.height - vh))
+            if (nx, ny) != (vx, vy):
+                vx, vy = nx, ny
+                dirty = True
+            return False
+
+        def on_detonate_or_pan() -> bool:
+            # D/d detonates a selected missile; otherwise it pans right
+            nonlocal selected, dirty, status_msg
+            if selected is not None and isinstance(selected, NuclearMissile) and selected.owner == current_player:
+                det_u, det_c = detonate_missile(world, units, current_player, selected.x, selected.y, radius=10)
+                kill_unit(selected)
+                dirty = True
+                # Remove dead missiles immediately from selection
+                selected = None
+                recompute_visibility(world, current_player, units)
+                # Show summary on status line
+                status_msg = f"Nuke: destroyed {det_u} units, neutralized {det_c} cities"
+                selected = select_next_unit(units, current_player, selected)
+                return False
+            return pan(1, 0)
+
+        def on_next_unit() -> bool:
+            # Cycle through all own units (even if out of moves) so Armies can found cities after moving
+            nonlocal selected, dirty
+            selected = select_next_unit_any(units, current_player, selected)
+            dirty = True
+            return False
+
+        def on_build_army() -> bool:
+            # Set production at focused or hovered city
+            target_city = resolve_target_city(world, current_player, focused_city_index, selected)
+            if target_city is not None:
+                set_city_production(target_city, 'Army')
+            return False
+
+        def on_found_city() -> bool:
+            # Found city from selected army, if valid
+            nonlocal selected, dirty
+            if selected is not None and selected.owner == current_player:
+                if found_city_from_army(world, units, selected):
+                    dirty = True
+                    # Update visibility for current player due to new city sight
+                    recompute_visibility(world, current_player, units)
+                    # Auto-select next unit since this one is gone
+                    selected = select_next_unit(units, current_player, None)
+            return False
+
+        def on_build_fighter() -> bool:
+            target_city = resolve_target_city(world, current_player, focused_city_index, selected)
+            if target_city is not None:
+                set_city_production(target_city, 'Fighter')
+            return False
+
+        def on_cycle_production() -> bool:
+            target_city = resolve_target_city(world, current_player, focused_city_index, selected)
+            if target_city is not None:
+                cycle_city_production(target_city)
+            return False
+
+        def on_focus_city() -> bool:
+            nonlocal focused_city_index, vx, vy, dirty
+            if own_cities:
+                dirty = True
+                focused_city_index = 0 if focused_city_index is None else (focused_city_index + 1) % len(own_cities)
+                fc = own_cities[focused_city_index]
+                vx, vy = center_view_on(world, vw, vh, fc.x, fc.y)
+            return False
+
+        def prompt_input(prompt: str, above: Optional[str] = None) -> str:
+            # Read one line on the status row (echo + cursor on while typing);
+            # `above`, if given, is shown on the row just over it. "" on error.
+            stdscr.move(vh, 0)
+            stdscr.clrtoeol()
+            _addnstr(vh, 0, prompt, vw)
+            if above is not None:
+                try:
+                    _addnstr(max(0, vh - 1), 0, above, vw)
+                except Exception:
+                    pass
+            _refresh()
+            curses.echo()
+            try:
+                curses.curs_set(1)
+            except Exception:
+                pass
+            maxlen = max(1, min(50, vw - len(prompt) - 1))
+            try:
+                name = stdscr.getstr(vh, min(vw - 1, len(prompt)), maxlen).decode('utf-8').strip()
+            except Exception:
+                name = ""
+            try:
+                curses.curs_set(0)
+            except Exception:
+                pass
+            curses.noecho()
+            return name
+
+        def prompt_load() -> str:
+            # Load prompt with the available saves listed one line above
+            try:
+                saves = list_saves()
+                listing: Optional[str] = "Saves: " + (" ".join(saves) if saves else "(none)")
+            except Exception:
+                listing = None
+            return prompt_input("Load name (no extension): ", above=listing)
+
+        def on_save() -> bool:
+            # Save game prompt
+            nonlocal status_msg
+            name = prompt_input("Save as (no extension): ")
+            if name:
+                save_dir = ensure_save_dir()
+                path = os.path.join(save_dir, f"{name}.json")
+                players_data = [
+                    {"name": p1.name, "is_ai": p1.is_ai, "cities": p1.cities},
+                    {"name": p2.name, "is_ai": p2.is_ai, "cities": p2.cities},
+                ]
+                save_full_game(path, world, units, players_data, turn_number, current_player)
+                status_msg = f"Saved to {path}"
+            return False
+
+        def on_load() -> bool:
+            nonlocal full_redraw, turn_number, current_player, vx, vy
+            # The saves listing overwrites a map row; repaint everything afterwards
+            full_redraw = True
+            name = prompt_load()
+            if name:
+                save_dir = ensure_save_dir()
+                path = os.path.join(save_dir, f"{name}.json")
+                data = load_full_game(path)
+                # Rehydrate map, units, players, turn and visibility
+                turn_number, current_player = restore_game(world, units, p1, p2, data, turn_number, current_player)
+                # Center camera
+                sel = select_next_unit(units, current_player, None)
+                if sel is not None:
+                    vx, vy = center_view_on(world, vw, vh, sel.x, sel.y)
+            # Set production at city under selected unit, if owned
+            if selected is not None and selected.owner == current_player:
+                c = city_at(world, selected.x, selected.y)
+                if c is not None and c.owner == current_player:
+                    c.production_type = 'Army'
+                    c.production_cost = 8
+                    # keep progress
+            return False
+
+        def on_end_turn() -> bool:
+            # End turn: production, switch player, reset moves, check victory
+            nonlocal full_redraw, current_player, turn_number, selected, vx, vy
+            advance_production_and_spawn(world, units)
+            # Fighter basing: current player's fighters must be on friendly city
+            enforce_fighter_basing(world, units, current_player)
+            # Victory check: opponent has zero cities
+            opponent = p2.name if current_player == p1.name else p1.name
+            if has_won(world, current_player, opponent):
+                _addnstr(vh, 0, f"{current_player} wins! Press Q to quit.", vw)
+                _refresh()
+                # wait for Q
+                while True:
+                    k2 = _getch()
+                    if k2 in (ord('q'), ord('Q')):
+                        return True
+            # Handoff screen: hide map and wait for SPACE to start next turn
+            full_redraw = True
+            stdscr.erase()
+            handoff_msg1 = f"Turn over for {current_player}. Hand off to {opponent}."
+            handoff_msg2 = "Press SPACE to start your turn."
+            # Center messages
+            msg_y = vh // 2
+            msg_x1 = max(0, (vw - len(handoff_msg1)) // 2)
+            msg_x2 = max(0, (vw - len(handoff_msg2)) // 2)
+            _addnstr(msg_y, msg_x1, handoff_msg1, vw)
+            _addnstr(msg_y + 1, msg_x2, handoff_msg2, vw)
+            _refresh()
+            while True:
+                k2 = _getch()
+                if k2 == ord(' '):
+                    break
+            current_player = opponent
+            turn_number += 1
+            reset_moves_for_owner(units, current_player)
+            selected = select_next_unit(units, current_player, None)
+            if selected is not None:
+                vx, vy = center_view_on(world, vw, vh, selected.x, selected.y)
+            recompute_visibility(world, current_player, units)
+            return False
+
+        # Key code -> handler, built once. Bindings are added in the old elif-chain
+        # order and the first one wins on a clash.
+        dispatch: Dict[int, Callable[[], bool]] = {}
+
+        def bind(chars: str, handler: Callable[[], bool]) -> None:
+            for ch in chars:
+                dispatch.setdefault(ord(ch), handler)
+
+        for _code, (_dx, _dy) in MOVE_KEYS.items():
+            dispatch[_code] = lambda dx=_dx, dy=_dy: handle_move(dx, dy)
+        bind('dD', on_detonate_or_pan)
+        bind('qQ', on_quit)
+        bind('aA', lambda: pan(-1, 0))
+        bind('wW', lambda: pan(0, -1))
+        bind('sS', lambda: pan(0, 1))
+        bind('nN', on_next_unit)
+        bind('bB', on_build_army)
+        bind('fF', on_found_city)
+        bind('rR', on_build_fighter)
+        bind('pP', on_cycle_production)
+        bind('cC', on_focus_city)
+        # Save lives on V: S was always claimed by pan-down above, which left the
+        # old S binding (and its sidebar hint) dead
+        bind('vV', on_save)
+        bind('oO', on_load)
+        bind(' ', on_end_turn)
+
         while True:
+            own_cities = get_own_cities(world, current_player)
+            # Resolved once per frame for the focus highlight and the status line
+            focused_city = focused_city_at(world, current_player, focused_city_index)
             # Dynamically adapt viewport size to current terminal window
             try:
                 max_y, max_x = stdscr.getmaxyx()
             except Exception:
                 max_y, max_x = vh + 1, vw
+            if (max_y, max_x) != last_size:
+                last_size = (max_y, max_x)
+                full_redraw = True
             new_vw = max(20, min(world.width, max_x - sidebar_w))
             new_vh = max(10, min(world.height, max_y - 1))
             if new_vw != vw or new_vh != vh:
                 vw, vh = new_vw, new_vh
-                vx = clamp(vx, 0, max(0, world.width - vw))
-                vy = clamp(vy, 0, max(0, world.height - vh))
-            view: Viewport = (vx, vy, vw, vh)
-            lines = render_view(world, view, units, active_player=current_player)
-            # Precompute stats panel lines if full map fits
-            show_full_map = (vw >= world.width and vh >= world.height)
-            stats_lines: List[str] = []
-            if show_full_map:
-                avail = max(0, max_x - (vw + 1 + sidebar_w) - 1)
-                stats_lines = build_stats_lines(current_player, units, vw, world, sidebar_w, max_cols=avail)
-            stdscr.erase()
-            for row_idx, line in enumerate(lines[:vh]):
-                # Draw map line
-                stdscr.addstr(row_idx, 0, line[:vw])
-                # Highlight selected unit tile (reverse video)
-                if selected is not None and selected.is_alive():
-                    sx, sy = selected.x - vx, selected.y - vy
-                    if sy == row_idx and 0 <= sx < vw:
+                vx, vy = _clamp_pair(vx, vy, world.width, world.height, vw, vh)
+            if full_redraw:
+                dirty = True
+            if dirty:
+                view: Viewport = (vx, vy, vw, vh)
+                lines = render_view(world, view, units, active_player=current_player)
+                # Precompute stats panel lines if full map fits
+                show_full_map = (vw >= world.width and vh >= world.height)
+                stats_lines: List[str] = []
+                if show_full_map:
+                    avail = max(0, max_x - (vw + 1 + sidebar_w) - 1)
+                    stats_lines = build_stats_lines(current_player, units, vw, world, sidebar_w, max_cols=avail)
+                if full_redraw:
+                    # Same effect as erase() for a window drawn from the origin
+                    stdscr.move(0, 0)
+                    stdscr.clrtobot()
+                    prev_rows = []
+                    full_redraw = False
+                sel_x, sel_y = (selected.x - vx, selected.y - vy) if selected is not None and selected.is_alive() else (-1, -1)
+                foc_x, foc_y = (focused_city.x - vx, focused_city.y - vy) if focused_city is not None else (-1, -1)
+                offset = vw + 1 + sidebar_w
+                row_w = max_x - 1
+                n_rows = min(vh, len(lines))
+                if len(sidebar_cells) < n_rows:
+                    sidebar_cells.extend([""] * (n_rows - len(sidebar_cells)))
+                n_stats = len(stats_lines) if show_full_map and offset < max_x else 0
+                for row_idx in range(n_rows):
+                    # One string per row: map line, sidebar, and (full map only) the stats
+                    # panel, padded to the screen width so it also blanks stale text and
+                    # cut to it so a narrow terminal never wraps into the next row
+                    row_buf = lines[row_idx][:vw].ljust(vw) + sidebar_cells[row_idx]
+                    if row_idx < n_stats:
+                        row_buf = row_buf.ljust(offset) + stats_lines[row_idx][:max(0, max_x - offset - 1)]
+                    row_buf = row_buf.ljust(row_w)[:row_w]
+                    sx = sel_x if sel_y == row_idx and 0 <= sel_x < vw else -1
+                    cx = foc_x if foc_y == row_idx and 0 <= foc_x < vw else -1
+                    sig = (row_buf, sx, cx)
+                    if row_idx < len(prev_rows):
+                        if prev_rows[row_idx] == sig:
+                            continue
+                        prev_rows[row_idx] = sig
+                    else:
+                        prev_rows.append(sig)
+                    _addstr(row_idx, 0, row_buf)
+                    # Highlight selected unit tile (reverse video)
+                    if sx >= 0:
                         try:
-                            stdscr.chgat(row_idx, sx, 1, curses.A_REVERSE)
+                            _chgat(row_idx, sx, 1, a_reverse)
                         except Exception:
                             pass
-                # Highlight focused city tile (standout)
-                if focused_city_index is not None:
-                    own_cities = [c for c in world.cities if c.owner == current_player]
-                    if own_cities:
-                        fc = own_cities[focused_city_index % len(own_cities)]
-                        cx, cy = fc.x - vx, fc.y - vy
-                        if cy == row_idx and 0 <= cx < vw:
-                            try:
-                                stdscr.chgat(row_idx, cx, 1, curses.A_BOLD)
-                            except Exception:
-                                pass
-                # right-side sidebar content
-                if row_idx < len(sidebar_lines):
-                    stdscr.addstr(row_idx, vw + 1, sidebar_lines[row_idx][:sidebar_w - 1])
-                # Draw stats panel to the right of sidebar when full map visible
-                if show_full_map and row_idx < len(stats_lines):
-                    offset = vw + 1 + sidebar_w
-                    if offset < max_x:
-                        stdscr.addstr(row_idx, offset, stats_lines[row_idx][:max(0, max_x - offset - 1)])
+                    # Highlight focused city tile (standout)
+                    if cx >= 0:
+                        try:
+                            _chgat(row_idx, cx, 1, a_bold)
+                        except Exception:
+                            pass
+                dirty = False
 
             city_under_view: Optional[City] = None
-            # Status: player, turn, selected unit, hint keys
-            sel_txt = "none"
-            if selected is not None and selected.is_alive():
-                sel_txt = f"{selected.owner} A @({selected.x},{selected.y}) hp:{selected.hp}/{selected.max_hp} mp:{selected.moves_left}"
-            # City info under selected unit
-            city_info = ""
-            if selected is not None and selected.is_alive():
-                c = city_at(world, selected.x, selected.y)
-                if c is not None and c.owner == current_player and c.production_type and c.production_cost > 0:
+            # Status: player, turn, selected unit, hint keys. Only reformatted when
+            # something it shows differs from the previous frame.
+            sel_alive = selected is not None and selected.is_alive()
+            c = city_at(world, selected.x, selected.y) if sel_alive else None
+            if c is not None and c.owner != current_player:
+                c = None
+            fc = focused_city
+            new_key = (
+                current_player, turn_number,
+                (selected.owner, selected.x, selected.y, selected.hp, selected.max_hp, selected.moves_left) if sel_alive else None,
+                (c.production_type, c.production_cost, c.production_progress) if c is not None else None,
+                (fc.x, fc.y, fc.production_type, fc.production_cost, fc.production_progress) if fc is not None else None,
+            )
+            if new_key != status_key:
+                status_key = new_key
+                sel_txt = "none"
+                if sel_alive:
+                    sel_txt = f"{selected.owner} A @({selected.x},{selected.y}) hp:{selected.hp}/{selected.max_hp} mp:{selected.moves_left}"
+                # City info under selected unit
+                city_info = ""
+                if c is not None and c.production_type and c.production_cost > 0:
                     eta = max(0, c.production_cost - c.production_progress)
                     city_info = f" | City: {c.production_type} ETA {eta}"
-            # Focused city info
-            focus_info = ""
-            if focused_city_index is not None:
-                own_cities = [c for c in world.cities if c.owner == current_player]
-                if own_cities:
-                    fc = own_cities[focused_city_index % len(own_cities)]
+                # Focused city info
+                focus_info = ""
+                if fc is not None:
                     eta2 = max(0, (fc.production_cost or 0) - (fc.production_progress or 0)) if fc.production_cost else 0
                     ptxt = fc.production_type or "(none)"
                     focus_info = f" | Focus: ({fc.x},{fc.y}) {ptxt} ETA {eta2}"
-            status = (
-                f"P:{current_player} T:{turn_number} "
-                f"| Sel:{sel_txt}{city_info}{focus_info}"
-            )
-            stdscr.addstr(vh, 0, status[:vw])
-            stdscr.refresh()
-
-            key = stdscr.getch()
-            # Pre-handle missile detonation on D/d to avoid conflicts with pan key 'D'
-            if key in (ord('d'), ord('D')):
-                if selected is not None and isinstance(selected, NuclearMissile) and selected.owner == current_player:
-                    det_u, det_c = detonate_missile(world, units, current_player, selected.x, selected.y, radius=10)
-                    selected.hp = 0
-                    selected = None
-                    recompute_visibility(world, current_player, units)
-                    msg = f"Nuke: destroyed {det_u} units, neutralized {det_c} cities"
-                    stdscr.addstr(vh, 0, msg[:vw])
-                    stdscr.refresh()
-                    selected = select_next_unit(units, current_player, selected)
-                    continue
-            if key in (ord('q'), ord('Q')):
-                # confirm quit if game in progress
-                stdscr.addstr(vh, 0, "Quit? (y/N)"[:vw])
-                stdscr.refresh()
-                k2 = stdscr.getch()
-                if k2 in (ord('y'), ord('Y')):
-                    break
-                else:
-                    continue
-            elif key in (ord('a'), ord('A')):
-                vx = clamp(vx - 1, 0, max(0, world.width - vw))
-            elif key in (ord('d'), ord('D')):
-                vx = clamp(vx + 1, 0, max(0, world.width - vw))
-            elif key in (ord('w'), ord('W')):
-                vy = clamp(vy - 1, 0, max(0, world.height - vh))
-            elif key in (ord('s'), ord('S')):
-                vy = clamp(vy + 1, 0, max(0, world.height - vh))
-            elif key in (ord('n'), ord('N')):
-                # Cycle through all own units (even if out of moves) so Armies can found cities after moving
-                selected = select_next_unit_any(units, current_player, selected)
-            elif key == curses.KEY_UP or key == getattr(curses, 'KEY_UP', -999) or key == getattr(curses, 'KEY_A2', -999) or key == getattr(curses, 'KEY_SR', -999) or key == getattr(curses, 'KEY_BTAB', -999) or key == getattr(curses, 'KEY_SUP', -999) or key == getattr(curses, 'KEY_NUMPAD8', -999):
-                if selected is None:
-                    selected = select_next_unit(units, current_player, selected)
-                if selected is not None and selected.owner == current_player:
-                    moved, captured, victory, _ = try_move_unit(world, units, selected, 0, -1)
-                    if victory:
-                        stdscr.addstr(vh, 0, f"{current_player} wins! Press Q to quit."[:vw])
-                        stdscr.refresh()
-                        while True:
-                            k2 = stdscr.getch()
-                            if k2 in (ord('q'), ord('Q')):
-                                return
-                    if moved:
-                        # update FoW after move
-                        recompute_visibility(world, current_player, units)
-                        # keep selection if unit still has moves
-                        if not (selected is not None and selected.is_alive() and selected.can_move()):
-                            selected = select_next_unit(units, current_player, selected)
-            elif key == curses.KEY_DOWN or key == getattr(curses, 'KEY_DOWN', -999) or key == getattr(curses, 'KEY_C2', -999) or key == getattr(curses, 'KEY_SF', -999) or key == getattr(curses, 'KEY_SDOWN', -999) or key == getattr(curses, 'KEY_NUMPAD2', -999):
-                if selected is None:
-                    selected = select_next_unit(units, current_player, selected)
-                if selected is not None and selected.owner == current_player:
-                    moved, captured, victory, _ = try_move_unit(world, units, selected, 0, 1)
-                    if victory:
-                        stdscr.addstr(vh, 0, f"{current_player} wins! Press Q to quit."[:vw])
-                        stdscr.refresh()
-                        while True:
-                            k2 = stdscr.getch()
-                            if k2 in (ord('q'), ord('Q')):
-                                return
-                    if moved:
-                        recompute_visibility(world, current_player, units)
-                        if not (selected is not None and selected.is_alive() and selected.can_move()):
-                            selected = select_next_unit(units, current_player, selected)
-            elif key == curses.KEY_LEFT or key == getattr(curses, 'KEY_LEFT', -999) or key == getattr(curses, 'KEY_B1', -999) or key == getattr(curses, 'KEY_SLEFT', -999) or key == getattr(curses, 'KEY_NUMPAD4', -999):
-                if selected is None:
-                    selected = select_next_unit(units, current_player, selected)
-                if selected is not None and selected.owner == current_player:
-                    moved, captured, victory, _ = try_move_unit(world, units, selected, -1, 0)
-                    if victory:
-                        stdscr.addstr(vh, 0, f"{current_player} wins! Press Q to quit."[:vw])
-                        stdscr.refresh()
-                        while True:
-                            k2 = stdscr.getch()
-                            if k2 in (ord('q'), ord('Q')):
-                                return
-                    if moved:
-                        recompute_visibility(world, current_player, units)
-                        if not (selected is not None and selected.is_alive() and selected.can_move()):
-                            selected = select_next_unit(units, current_player, selected)
-            elif key == curses.KEY_RIGHT or key == getattr(curses, 'KEY_RIGHT', -999) or key == getattr(curses, 'KEY_B3', -999) or key == getattr(curses, 'KEY_SRIGHT', -999) or key == getattr(curses, 'KEY_NUMPAD6', -999):
-                if selected is None:
-                    selected = select_next_unit(units, current_player, selected)
-                if selected is not None and selected.owner == current_player:
-                    moved, captured, victory, _ = try_move_unit(world, units, selected, 1, 0)
-                    if victory:
-                        stdscr.addstr(vh, 0, f"{current_player} wins! Press Q to quit."[:vw])
-                        stdscr.refresh()
-                        while True:
-                            k2 = stdscr.getch()
-                            if k2 in (ord('q'), ord('Q')):
-                                return
-                    if moved:
-                        recompute_visibility(world, current_player, units)
-                        if not (selected is not None and selected.is_alive() and selected.can_move()):
-                            selected = select_next_unit(units, current_player, selected)
-            # Number keys 8/2/4/6 for movement (NumLock on)
-            elif key in (ord('8'),):
-                if selected is None:
-                    selected = select_next_unit(units, current_player, selected)
-                if selected is not None and selected.owner == current_player:
-                    moved, captured, victory, _ = try_move_unit(world, units, selected, 0, -1)
-                    if victory:
-                        stdscr.addstr(vh, 0, f"{current_player} wins! Press Q to quit."[:vw])
-                        stdscr.refresh()
-                        while True:
-                            k2 = stdscr.getch()
-                            if k2 in (ord('q'), ord('Q')):
-                                return
-                    if moved:
-                        recompute_visibility(world, current_player, units)
-                        if not (selected is not None and selected.is_alive() and selected.can_move()):
-                            selected = select_next_unit(units, current_player, selected)
-            elif key in (ord('2'),):
-                if selected is None:
-                    selected = select_next_unit(units, current_player, selected)
-                if selected is not None and selected.owner == current_player:
-                    moved, captured, victory, _ = try_move_unit(world, units, selected, 0, 1)
-                    if victory:
-                        stdscr.addstr(vh, 0, f"{current_player} wins! Press Q to quit."[:vw])
-                        stdscr.refresh()
-                        while True:
-                            k2 = stdscr.getch()
-                            if k2 in (ord('q'), ord('Q')):
-                                return
-                    if moved:
-                        recompute_visibility(world, current_player, units)
-                        if not (selected is not None and selected.is_alive() and selected.can_move()):
-                            selected = select_next_unit(units, current_player, selected)
-            elif key in (ord('4'),):
-                if selected is None:
-                    selected = select_next_unit(units, current_player, selected)
-                if selected is not None and selected.owner == current_player:
-                    moved, captured, victory, _ = try_move_unit(world, units, selected, -1, 0)
-                    if victory:
-                        stdscr.addstr(vh, 0, f"{current_player} wins! Press Q to quit."[:vw])
-                        stdscr.refresh()
-                        while True:
-                            k2 = stdscr.getch()
-                            if k2 in (ord('q'), ord('Q')):
-                                return
-                    if moved:
-                        recompute_visibility(world, current_player, units)
-                        if not (selected is not None and selected.is_alive() and selected.can_move()):
-                            selected = select_next_unit(units, current_player, selected)
-            elif key in (ord('6'),):
-                if selected is None:
-                    selected = select_next_unit(units, current_player, selected)
-                if selected is not None and selected.owner == current_player:
-                    moved, captured, victory, _ = try_move_unit(world, units, selected, 1, 0)
-                    if victory:
-                        stdscr.addstr(vh, 0, f"{current_player} wins! Press Q to quit."[:vw])
-                        stdscr.refresh()
-                        while True:
-                            k2 = stdscr.getch()
-                            if k2 in (ord('q'), ord('Q')):
-                                return
-                    if moved:
-                        recompute_visibility(world, current_player, units)
-                        if not (selected is not None and selected.is_alive() and selected.can_move()):
-                            selected = select_next_unit(units, current_player, selected)
-            # Numpad diagonals (support common curses keycodes)
-            elif key in (getattr(curses, 'KEY_A1', -999), getattr(curses, 'KEY_HOME', -999)):
-                if selected is None:
-                    selected = select_next_unit(units, current_player, selected)
-                if selected is not None and selected.owner == current_player:
-                    moved, captured, victory, _ = try_move_unit(world, units, selected, -1, -1)
-                    if victory:
-                        stdscr.addstr(vh, 0, f"{current_player} wins! Press Q to quit."[:vw])
-                        stdscr.refresh()
-                        while True:
-                            k2 = stdscr.getch()
-                            if k2 in (ord('q'), ord('Q')):
-                                return
-                    if moved:
-                        recompute_visibility(world, current_player, units)
-                        if not (selected is not None and selected.is_alive() and selected.can_move()):
-                            selected = select_next_unit(units, current_player, selected)
-            elif key in (getattr(curses, 'KEY_A3', -999), getattr(curses, 'KEY_PPAGE', -999)):
-                if selected is None:
-                    selected = select_next_unit(units, current_player, selected)
-                if selected is not None and selected.owner == current_player:
-                    moved, captured, victory, _ = try_move_unit(world, units, selected, 1, -1)
-                    if victory:
-                        stdscr.addstr(vh, 0, f"{current_player} wins! Press Q to quit."[:vw])
-                        stdscr.refresh()
-                        while True:
-                            k2 = stdscr.getch()
-                            if k2 in (ord('q'), ord('Q')):
-                                return
-                    if moved:
-                        recompute_visibility(world, current_player, units)
-                        if not (selected is not None and selected.is_alive() and selected.can_move()):
-                            selected = select_next_unit(units, current_player, selected)
-            elif key in (getattr(curses, 'KEY_C1', -999), getattr(curses, 'KEY_END', -999)):
-                if selected is None:
-                    selected = select_next_unit(units, current_player, selected)
-                if selected is not None and selected.owner == current_player:
-                    moved, captured, victory, _ = try_move_unit(world, units, selected, -1, 1)
-                    if victory:
-                        stdscr.addstr(vh, 0, f"{current_player} wins! Press Q to quit."[:vw])
-                        stdscr.refresh()
-                        while True:
-                            k2 = stdscr.getch()
-                            if k2 in (ord('q'), ord('Q')):
-                                return
-                    if moved:
-                        recompute_visibility(world, current_player, units)
-                        if not (selected is not None and selected.is_alive() and selected.can_move()):
-                            selected = select_next_unit(units, current_player, selected)
-            elif key in (getattr(curses, 'KEY_C3', -999), getattr(curses, 'KEY_NPAGE', -999)):
-                if selected is None:
-                    selected = select_next_unit(units, current_player, selected)
-                if selected is not None and selected.owner == current_player:
-                    moved, captured, victory, _ = try_move_unit(world, units, selected, 1, 1)
-                    if victory:
-                        stdscr.addstr(vh, 0, f"{current_player} wins! Press Q to quit."[:vw])
-                        stdscr.refresh()
-                        while True:
-                            k2 = stdscr.getch()
-                            if k2 in (ord('q'), ord('Q')):
-                                return
-                    if moved:
-                        recompute_visibility(world, current_player, units)
-                        if not (selected is not None and selected.is_alive() and selected.can_move()):
-                            selected = select_next_unit(units, current_player, selected)
-                    if victory:
-                        stdscr.addstr(vh, 0, f"{current_player} wins! Press Q to quit."[:vw])
-                        stdscr.refresh()
-                        while True:
-                            k2 = stdscr.getch()
-                            if k2 in (ord('q'), ord('Q')):
-                                return
-                    if moved:
-                        recompute_visibility(world, current_player, units)
-                        if not (selected is not None and selected.is_alive() and selected.can_move()):
-                            selected = select_next_unit(units, current_player, selected)
-            # Space now ends turn (see below)
-            elif key in (ord('b'), ord('B')):
-                # Set production at focused or hovered city
-                target_city: Optional[City] = None
-                if focused_city_index is not None:
-                    own_cities = [c for c in world.cities if c.owner == current_player]
-                    if own_cities:
-                        target_city = own_cities[focused_city_index % len(own_cities)]
-                if target_city is None and selected is not None and selected.owner == current_player:
-                    target_city = city_at(world, selected.x, selected.y)
-                if target_city is not None and target_city.owner == current_player:
-                    set_city_production(target_city, 'Army')
-            elif key in (ord('f'), ord('F')):
-                # Found city from selected army, if valid
-                if selected is not None and selected.owner == current_player:
-                    if found_city_from_army(world, units, selected):
-                        # Update visibility for current player due to new city sight
-                        recompute_visibility(world, current_player, units)
-                        # Auto-select next unit since this one is gone
-                        selected = select_next_unit(units, current_player, None)
-            elif key in (ord('r'), ord('R')):
-                target_city = None
-                if focused_city_index is not None:
-                    own_cities = [c for c in world.cities if c.owner == current_player]
-                    if own_cities:
-                        target_city = own_cities[focused_city_index % len(own_cities)]
-                if target_city is None and selected is not None and selected.owner == current_player:
-                    target_city = city_at(world, selected.x, selected.y)
-                if target_city is not None and target_city.owner == current_player:
-                    set_city_production(target_city, 'Fighter')
-            elif key in (ord('p'), ord('P')):
-                target_city = None
-                if focused_city_index is not None:
-                    own_cities = [c for c in world.cities if c.owner == current_player]
-                    if own_cities:
-                        target_city = own_cities[focused_city_index % len(own_cities)]
-                if target_city is None and selected is not None and selected.owner == current_player:
-                    target_city = city_at(world, selected.x, selected.y)
-                if target_city is not None and target_city.owner == current_player:
-                    cycle_city_production(target_city)
-            elif key in (ord('d'), ord('D')):
-                # Detonate missile at current position (if selected is a missile)
-                if selected is not None and isinstance(selected, NuclearMissile) and selected.owner == current_player:
-                    det_u, det_c = detonate_missile(world, units, current_player, selected.x, selected.y, radius=10)
-                    selected.hp = 0
-                    # Remove dead missiles immediately from selection
-                    selected = None
-                    recompute_visibility(world, current_player, units)
-                    # Show summary on status line
-                    msg = f"Nuke: destroyed {det_u} units, neutralized {det_c} cities"
-                    stdscr.addstr(vh, 0, msg[:vw])
-                    stdscr.refresh()
-                    selected = select_next_unit(units, current_player, selected)
-            elif key in (ord('c'), ord('C')):
-                own_cities = [c for c in world.cities if c.owner == current_player]
-                if own_cities:
-                    focused_city_index = 0 if focused_city_index is None else (focused_city_index + 1) % len(own_cities)
-                    fc = own_cities[focused_city_index]
-                    vx, vy = center_view_on(world, vw, vh, fc.x, fc.y)
-            elif key in (ord('s'), ord('S')):
-                # Save game prompt
-                prompt = "Save as (no extension): "
-                stdscr.move(vh, 0)
-                stdscr.clrtoeol()
-                stdscr.addstr(vh, 0, prompt[:vw])
-                stdscr.refresh()
-                curses.echo()
-                try:
-                    curses.curs_set(1)
-                except Exception:
-                    pass
-                maxlen = max(1, min(50, vw - len(prompt) - 1))
-                try:
-                    name = stdscr.getstr(vh, min(vw - 1, len(prompt)), maxlen).decode('utf-8').strip()
-                except Exception:
-                    name = ""
-                try:
-                    curses.curs_set(0)
-                except Exception:
-                    pass
-                curses.noecho()
-                if name:
-                    save_dir = ensure_save_dir()
-                    path = os.path.join(save_dir, f"{name}.json")
-                    players_data = [
-                        {"name": p1.name, "is_ai": p1.is_ai, "cities": list(p1.cities)},
-                        {"name": p2.name, "is_ai": p2.is_ai, "cities": list(p2.cities)},
-                    ]
-                    save_full_game(path, world, units, players_data, turn_number, current_player)
-                    stdscr.move(vh, 0)
-                    stdscr.clrtoeol()
-                    stdscr.addstr(vh, 0, f"Saved to {path}"[:vw])
-                    stdscr.refresh()
-            elif key in (ord('o'), ord('O')):
-                prompt = "Load name (no extension): "
-                stdscr.move(vh, 0)
-                stdscr.clrtoeol()
-                stdscr.addstr(vh, 0, prompt[:vw])
-                # List available saves one line above
-                try:
-                    list_y = max(0, vh - 1)
-                    save_dir = ensure_save_dir()
-                    saves = [fn[:-5] for fn in os.listdir(save_dir) if fn.lower().endswith('.json')]
-                    list_line = "Saves: " + (" ".join(sorted(saves)) if saves else "(none)")
-                    stdscr.addstr(list_y, 0, list_line[:vw])
-                except Exception:
-                    pass
-                stdscr.refresh()
-                curses.echo()
-                try:
-                    curses.curs_set(1)
-                except Exception:
-                    pass
-                maxlen = max(1, min(50, vw - len(prompt) - 1))
-                try:
-                    name = stdscr.getstr(vh, min(vw - 1, len(prompt)), maxlen).decode('utf-8').strip()
-                except Exception:
-                    name = ""
-                try:
-                    curses.curs_set(0)
-                except Exception:
-                    pass
-                curses.noecho()
-                if name:
-                    save_dir = ensure_save_dir()
-                    path = os.path.join(save_dir, f"{name}.json")
-                    data = load_full_game(path)
-                    # Rehydrate map, units, players, turn
-                    loaded_map = data["map"]
-                    world.width = loaded_map["width"]
-                    world.height = loaded_map["height"]
-                    world.tiles = loaded_map["tiles"]
-                    world.fog = loaded_map["fog"]
-                    world.cities = [City(**c) for c in loaded_map["cities"]]
-                    world.explored = loaded_map.get("explored", {})
-                    # Units
-                    units.clear()
-                    for ud in data["units"]:
-                        utype = ud.get("unit_type", "Army")
-                        if utype == "Fighter":
-                            u = Fighter(x=ud["x"], y=ud["y"], owner=ud["owner"]) 
-                        elif utype == "Carrier":
-                            u = Carrier(x=ud["x"], y=ud["y"], owner=ud["owner"]) 
-                        elif utype == "NuclearMissile":
-                            u = NuclearMissile(x=ud["x"], y=ud["y"], owner=ud["owner"]) 
-                        else:
-                            u = Army(x=ud["x"], y=ud["y"], owner=ud["owner"]) 
-                        u.symbol = ud.get("symbol", u.symbol)
-                        u.max_hp = ud.get("max_hp", u.max_hp)
-                        u.hp = ud.get("hp", u.hp)
-                        u.movement_points = ud.get("movement_points", u.movement_points)
-                        u.fuel = ud.get("fuel", None)
-                        u.moves_left = ud.get("moves_left", u.movement_points)
-                        u.home_city = tuple(ud["home_city"]) if ud.get("home_city") else None
-                        units.append(u)
-                    # Players
-                    pdat = data.get("players", [])
-                    if len(pdat) >= 2:
-                        p1.name = pdat[0].get("name", p1.name)
-                        p1.is_ai = pdat[0].get("is_ai", False)
-                        p1.cities = set(tuple(t) for t in pdat[0].get("cities", list(p1.cities)))
-                        p2.name = pdat[1].get("name", p2.name)
-                        p2.is_ai = pdat[1].get("is_ai", False)
-                        p2.cities = set(tuple(t) for t in pdat[1].get("cities", list(p2.cities)))
-                    turn_number = data.get("turn_number", turn_number)
-                    current_player = data.get("current_player", current_player)
-                    # Recompute visibility
-                    world.init_fow([p1.name, p2.name])
-                    if isinstance(world.explored, dict):
-                        # Restore explored; visible will be recomputed
-                        world.visible = {p1.name: [[False for _ in range(world.width)] for _ in range(world.height)], p2.name: [[False for _ in range(world.width)] for _ in range(world.height)]}
-                    recompute_visibility(world, current_player, units)
-                    # Center camera
-                    sel = select_next_unit(units, current_player, None)
-                    if sel is not None:
-                        vx, vy = center_view_on(world, vw, vh, sel.x, sel.y)
-                # Set production at city under selected unit, if owned
-                if selected is not None and selected.owner == current_player:
-                    c = city_at(world, selected.x, selected.y)
-                    if c is not None and c.owner == current_player:
-                        c.production_type = 'Army'
-                        c.production_cost = 8
-                        # keep progress
-            elif key in (ord(' '),):
-                # End turn: production, switch player, reset moves, check victory
-                advance_production_and_spawn(world, units)
-                # Fighter basing: current player's fighters must be on friendly city
-                enforce_fighter_basing(world, units, current_player)
-                # Victory check: opponent has zero cities
-                opponent = p2.name if current_player == p1.name else p1.name
-                opp_city_count = sum(1 for c in world.cities if c.owner == opponent)
-                my_city_count = sum(1 for c in world.cities if c.owner == current_player)
-                if opp_city_count == 0 and my_city_count > 0:
-                    stdscr.addstr(vh, 0, f"{current_player} wins! Press Q to quit."[:vw])
-                    stdscr.refresh()
-                    # wait for Q
-                    while True:
-                        k2 = stdscr.getch()
-                        if k2 in (ord('q'), ord('Q')):
-                            return
-                # Handoff screen: hide map and wait for SPACE to start next turn
-                stdscr.erase()
-                handoff_msg1 = f"Turn over for {current_player}. Hand off to {opponent}."
-                handoff_msg2 = "Press SPACE to start your turn."
-                # Center messages
-                msg_y = vh // 2
-                msg_x1 = max(0, (vw - len(handoff_msg1)) // 2)
-                msg_x2 = max(0, (vw - len(handoff_msg2)) // 2)
-                stdscr.addstr(msg_y, msg_x1, handoff_msg1[:vw])
-                stdscr.addstr(msg_y + 1, msg_x2, handoff_msg2[:vw])
-                stdscr.refresh()
-                while True:
-                    k2 = stdscr.getch()
-                    if k2 == ord(' '):
-                        break
-                current_player = opponent
-                turn_number += 1
-                reset_moves_for_owner(units, current_player)
-                selected = select_next_unit(units, current_player, None)
-                if selected is not None:
-                    vx, vy = center_view_on(world, vw, vh, selected.x, selected.y)
-                recompute_visibility(world, current_player, units)
+                status = (
+                    f"P:{current_player} T:{turn_number} "
+                    f"| Sel:{sel_txt}{city_info}{focus_info}"
+                )
+            stdscr.move(vh, 0)
+            stdscr.clrtoeol()
+            _addnstr(vh, 0, status if status_msg is None else status_msg, vw)
+            status_msg = None
+            _noutrefresh()
+            _doupdate()
+
+            key = _getch()
+            handler = dispatch.get(key)
+            if handler is not None and handler():
+                return
 
     curses.wrapper(_main)
 
@@ -1316,6 +1529,9 @@ def run_fallback(world: GameMap, p1: Player, p2: Player, units: List[Unit]) -> N
     vw, vh = min(world.width, 60), min(world.height, 20)
     # reduce vw to give space to sidebar in console output
     vw = max(20, vw - sidebar_w)
+    # The sidebar never changes, so its column (with the separating space) is
+    # formatted once; each frame only pads the board rows
+    right_col = [" " + (sidebar_lines[i] if i < len(sidebar_lines) else "") for i in range(vh)]
     vx, vy = 0, 0
     current_player = p1.name
     turn_number = 1
@@ -1334,14 +1550,165 @@ def run_fallback(world: GameMap, p1: Player, p2: Player, units: List[Unit]) -> N
     selected = select_next_unit(units, current_player, None)
     if selected is not None:
         vx, vy = center_view_on(world, vw, vh, selected.x, selected.y)
+    # Command handlers; each returns True to leave the game loop
+    def pan(dx: int, dy: int) -> bool:
+        nonlocal vx, vy
+        if dx:
+            vx = clamp(vx + dx, 0, max(0, world.width - vw))
+        if dy:
+            vy = clamp(vy + dy, 0, max(0, world.height - vh))
+        return False
+
+    def on_detonate() -> bool:
+        # d/D detonate a selected missile and do nothing otherwise (lowercase d pans
+        # right first; see exact_cmds)
+        nonlocal selected
+        if selected is not None and isinstance(selected, NuclearMissile) and selected.owner == current_player:
+            det_u, det_c = detonate_missile(world, units, current_player, selected.x, selected.y, radius=10)
+            kill_unit(selected)
+            recompute_visibility(world, current_player, units)
+            print(f"Nuke: destroyed {det_u} units, neutralized {det_c} cities")
+            selected = select_next_unit(units, current_player, None)
+        return False
+
+    def on_next_unit() -> bool:
+        nonlocal selected
+        selected = select_next_unit_any(units, current_player, selected)
+        return False
+
+    def on_skip() -> bool:
+        nonlocal selected
+        selected = select_next_unit(units, current_player, selected)
+        return False
+
+    def set_production(prod_type: str) -> bool:
+        target_city = resolve_target_city(world, current_player, focused_city_index, selected)
+        if target_city is not None:
+            set_city_production(target_city, prod_type)
+        return False
+
+    def on_cycle_production() -> bool:
+        target_city = resolve_target_city(world, current_player, focused_city_index, selected)
+        if target_city is not None:
+            cycle_city_production(target_city)
+        return False
+
+    def on_focus_city() -> bool:
+        nonlocal focused_city_index, vx, vy
+        own_cities = get_own_cities(world, current_player)
+        if own_cities:
+            focused_city_index = 0 if focused_city_index is None else (focused_city_index + 1) % len(own_cities)
+            fc = own_cities[focused_city_index]
+            vx, vy = center_view_on(world, vw, vh, fc.x, fc.y)
+        return False
+
+    def on_end_turn() -> bool:
+        nonlocal current_player, turn_number, selected, vx, vy
+        advance_production_and_spawn(world, units)
+        # Auto-detonate any missiles that have exceeded range or have moves <= 0 (safety)
+        # Copy: each blast kills units (possibly other missiles) and prunes the list
+        for u in list(LIVE_MISSILES):
+            if u.is_alive():
+                # End-turn rule: must detonate regardless of remaining moves
+                det_u, det_c = detonate_missile(world, units, u.owner, u.x, u.y, radius=10)
+                kill_unit(u)
+        enforce_fighter_basing(world, units, current_player)
+        opponent = p2.name if current_player == p1.name else p1.name
+        if has_won(world, current_player, opponent):
+            print(f"{current_player} wins!")
+            return True
+        input(f"Turn over for {current_player}. Hand off to {opponent}. Press Enter...")
+        current_player = opponent
+        turn_number += 1
+        reset_moves_for_owner(units, current_player)
+        selected = select_next_unit(units, current_player, None)
+        if selected is not None:
+            vx, vy = center_view_on(world, vw, vh, selected.x, selected.y)
+        recompute_visibility(world, current_player, units)
+        return False
+
+    def move_selected(dx: int, dy: int) -> bool:
+        nonlocal selected
+        if selected is None:
+            selected = select_next_unit(units, current_player, selected)
+        if selected is not None and selected.owner == current_player:
+            old_xy = (selected.x, selected.y)
+            moved, captured, victory, _ = try_move_unit(world, units, selected, dx, dy)
+            if victory:
+                print(f"{current_player} wins!")
+                return True
+            if moved:
+                update_visibility_after_move(world, current_player, units, selected, old_xy)
+                if not (selected is not None and selected.is_alive() and selected.can_move()):
+                    selected = select_next_unit(units, current_player, selected)
+        return False
+
+    def on_save(cmd: str) -> bool:
+        parts = cmd.split()
+        if len(parts) >= 2:
+            name = parts[1].strip()
+            if name:
+                save_dir = ensure_save_dir()
+                path = os.path.join(save_dir, f"{name}.json")
+                players_data = [
+                    {"name": p1.name, "is_ai": p1.is_ai, "cities": p1.cities},
+                    {"name": p2.name, "is_ai": p2.is_ai, "cities": p2.cities},
+                ]
+                save_full_game(path, world, units, players_data, turn_number, current_player)
+        return False
+
+    def on_load(cmd: str) -> bool:
+        nonlocal turn_number, current_player, vx, vy
+        parts = cmd.split()
+        if len(parts) >= 2:
+            name = parts[1].strip()
+            if name:
+                save_dir = ensure_save_dir()
+                path = os.path.join(save_dir, f"{name}.json")
+                data = load_full_game(path)
+                turn_number, current_player = restore_game(world, units, p1, p2, data, turn_number, current_player)
+                sel = select_next_unit(units, current_player, None)
+                if sel is not None:
+                    vx, vy = center_view_on(world, vw, vh, sel.x, sel.y)
+        else:
+            # List available saves
+            saves = list_saves()
+            print("Available saves:", ", ".join(saves) if saves else "(none)")
+        return False
+
+    # Built once: single-key commands are matched exactly (pans and production
+    # keys are lowercase only), the rest regardless of case
+    exact_cmds: Dict[str, Callable[[], bool]] = {
+        'a': lambda: pan(-1, 0),
+        # As in the old two-pass if-chains, lowercase d both pans right and then
+        # detonates a selected missile; pan() returns False, so `or` runs both
+        'd': lambda: pan(1, 0) or on_detonate(),
+        'w': lambda: pan(0, -1),
+        's': lambda: pan(0, 1),
+        'n': on_next_unit,
+        'b': lambda: set_production('Army'),
+        'r': lambda: set_production('Fighter'),
+        'p': on_cycle_production,
+        'c': on_focus_city,
+    }
+    caseless_cmds: Dict[str, Callable[[], bool]] = {
+        'd': on_detonate,
+        'e': on_end_turn,
+        'i': lambda: move_selected(0, -1),
+        'k': lambda: move_selected(0, 1),
+        'j': lambda: move_selected(-1, 0),
+        'l': lambda: move_selected(1, 0),
+        'skip': on_skip,
+        'wait': on_skip,
+    }
+
     print("Text UI. Commands: n=next, wasd=move, b=build, e=end, save <name>, load <name>, q=quit; arrows: pan")
     while True:
         view: Viewport = (vx, vy, vw, vh)
         board_lines = render_view(world, view, units, active_player=current_player)
-        for row_idx in range(vh):
-            left = board_lines[row_idx] if row_idx < len(board_lines) else ""
-            right = sidebar_lines[row_idx] if row_idx < len(sidebar_lines) else ""
-            print(f"{left:<{vw}} {right}")
+        nb = len(board_lines)
+        # One write per frame instead of one print per row
+        print("\n".join((board_lines[i] if i < nb else "").ljust(vw) + right_col[i] for i in range(vh)))
         sel_txt = "none" if selected is None else f"{selected.owner} A @({selected.x},{selected.y}) hp:{selected.hp}/{selected.max_hp} mp:{selected.moves_left}"
         # Show city info / ETA if under selected unit
         city_info = ""
@@ -1352,13 +1719,11 @@ def run_fallback(world: GameMap, p1: Player, p2: Player, units: List[Unit]) -> N
                 city_info = f" | City: {c.production_type} ETA {eta}"
         # Focused city info
         focus_info = ""
-        if focused_city_index is not None:
-            own_cities = [c for c in world.cities if c.owner == current_player]
-            if own_cities:
-                fc = own_cities[focused_city_index % len(own_cities)]
-                eta2 = max(0, (fc.production_cost or 0) - (fc.production_progress or 0)) if fc.production_cost else 0
-                ptxt = fc.production_type or "(none)"
-                focus_info = f" | Focus: ({fc.x},{fc.y}) {ptxt} ETA {eta2}"
+        fc = focused_city_at(world, current_player, focused_city_index)
+        if fc is not None:
+            eta2 = max(0, (fc.production_cost or 0) - (fc.production_progress or 0)) if fc.production_cost else 0
+            ptxt = fc.production_type or "(none)"
+            focus_info = f" | Focus: ({fc.x},{fc.y}) {ptxt} ETA {eta2}"
         print(f"P:{current_player} T:{turn_number} | Sel:{sel_txt}{city_info}{focus_info} | n/wasd/b/r/p/c/e/q | arrows pan")
         cmd = input("> ").strip()
         low = cmd.lower()
@@ -1366,206 +1731,18 @@ def run_fallback(world: GameMap, p1: Player, p2: Player, units: List[Unit]) -> N
             ans = input("Quit? (y/N) ").strip().lower()
             if ans == 'y':
                 break
-            else:
-                continue
-        elif cmd == 'a':
-            vx = clamp(vx - 1, 0, max(0, world.width - vw))
-        elif cmd == 'd':
-            vx = clamp(vx + 1, 0, max(0, world.width - vw))
-        elif cmd == 'w':
-            vy = clamp(vy - 1, 0, max(0, world.height - vh))
-        elif cmd == 's':
-            vy = clamp(vy + 1, 0, max(0, world.height - vh))
-        elif cmd == 'n':
-            selected = select_next_unit_any(units, current_player, selected)
-        elif cmd in ('i', 'k', 'j', 'l', 'up', 'down', 'left', 'right', 'move', 'm', 'wasd'):
-            # support 'i/j/k/l' or 'w/a/s/d' style by checking exact strings next
-            pass
-        elif cmd == 'b':
-            target_city = None
-            if focused_city_index is not None:
-                own_cities = [c for c in world.cities if c.owner == current_player]
-                if own_cities:
-                    target_city = own_cities[focused_city_index % len(own_cities)]
-            if target_city is None and selected is not None and selected.owner == current_player:
-                target_city = city_at(world, selected.x, selected.y)
-            if target_city is not None and target_city.owner == current_player:
-                set_city_production(target_city, 'Army')
-        elif cmd == 'r':
-            target_city = None
-            if focused_city_index is not None:
-                own_cities = [c for c in world.cities if c.owner == current_player]
-                if own_cities:
-                    target_city = own_cities[focused_city_index % len(own_cities)]
-            if target_city is None and selected is not None and selected.owner == current_player:
-                target_city = city_at(world, selected.x, selected.y)
-            if target_city is not None and target_city.owner == current_player:
-                set_city_production(target_city, 'Fighter')
-        elif cmd == 'p':
-            target_city = None
-            if focused_city_index is not None:
-                own_cities = [c for c in world.cities if c.owner == current_player]
-                if own_cities:
-                    target_city = own_cities[focused_city_index % len(own_cities)]
-            if target_city is None and selected is not None and selected.owner == current_player:
-                target_city = city_at(world, selected.x, selected.y)
-            if target_city is not None and target_city.owner == current_player:
-                cycle_city_production(target_city)
-        elif cmd == 'c':
-            own_cities = [c for c in world.cities if c.owner == current_player]
-            if own_cities:
-                focused_city_index = 0 if focused_city_index is None else (focused_city_index + 1) % len(own_cities)
-                fc = own_cities[focused_city_index]
-                vx, vy = center_view_on(world, vw, vh, fc.x, fc.y)
-        elif low == 'e':
-            advance_production_and_spawn(world, units)
-            # Auto-detonate any missiles that have exceeded range or have moves <= 0 (safety)
-            for u in list(units):
-                if isinstance(u, NuclearMissile) and u.is_alive():
-                    # End-turn rule: must detonate regardless of remaining moves
-                    det_u, det_c = detonate_missile(world, units, u.owner, u.x, u.y, radius=10)
-                    u.hp = 0
-            enforce_fighter_basing(world, units, current_player)
-            opponent = p2.name if current_player == p1.name else p1.name
-            opp_city_count = sum(1 for c in world.cities if c.owner == opponent)
-            my_city_count = sum(1 for c in world.cities if c.owner == current_player)
-            if opp_city_count == 0 and my_city_count > 0:
-                print(f"{current_player} wins!")
-                break
-            input(f"Turn over for {current_player}. Hand off to {opponent}. Press Enter...")
-            current_player = opponent
-            turn_number += 1
-            reset_moves_for_owner(units, current_player)
-            selected = select_next_unit(units, current_player, None)
-            if selected is not None:
-                vx, vy = center_view_on(world, vw, vh, selected.x, selected.y)
-            recompute_visibility(world, current_player, units)
-        # Movement commands and skip
-        if low in ('i',):
-            if selected is None:
-                selected = select_next_unit(units, current_player, selected)
-            if selected is not None and selected.owner == current_player:
-                moved, captured, victory, _ = try_move_unit(world, units, selected, 0, -1)
-                if victory:
-                    print(f"{current_player} wins!")
-                    break
-                if moved:
-                    recompute_visibility(world, current_player, units)
-                    if not (selected is not None and selected.is_alive() and selected.can_move()):
-                        selected = select_next_unit(units, current_player, selected)
-        elif low in ('k',):
-            if selected is None:
-                selected = select_next_unit(units, current_player, selected)
-            if selected is not None and selected.owner == current_player:
-                moved, captured, victory, _ = try_move_unit(world, units, selected, 0, 1)
-                if victory:
-                    print(f"{current_player} wins!")
-                    break
-                if moved:
-                    recompute_visibility(world, current_player, units)
-                    if not (selected is not None and selected.is_alive() and selected.can_move()):
-                        selected = select_next_unit(units, current_player, selected)
-        elif low in ('j',):
-            if selected is None:
-                selected = select_next_unit(units, current_player, selected)
-            if selected is not None and selected.owner == current_player:
-                moved, captured, victory, _ = try_move_unit(world, units, selected, -1, 0)
-                if victory:
-                    print(f"{current_player} wins!")
-                    break
-                if moved:
-                    recompute_visibility(world, current_player, units)
-                    if not (selected is not None and selected.is_alive() and selected.can_move()):
-                        selected = select_next_unit(units, current_player, selected)
-        elif low in ('l',):
-            if selected is None:
-                selected = select_next_unit(units, current_player, selected)
-            if selected is not None and selected.owner == current_player:
-                moved, captured, victory, _ = try_move_unit(world, units, selected, 1, 0)
-                if victory:
-                    print(f"{current_player} wins!")
-                    break
-                if moved:
-                    recompute_visibility(world, current_player, units)
-                    if not (selected is not None and selected.is_alive() and selected.can_move()):
-                        selected = select_next_unit(units, current_player, selected)
-        elif low in (' ', 'skip', 'wait'):
-            selected = select_next_unit(units, current_player, selected)
-        elif low in ('d',):
-            if selected is not None and isinstance(selected, NuclearMissile) and selected.owner == current_player:
-                det_u, det_c = detonate_missile(world, units, current_player, selected.x, selected.y, radius=10)
-                selected.hp = 0
-                recompute_visibility(world, current_player, units)
-                print(f"Nuke: destroyed {det_u} units, neutralized {det_c} cities")
-                selected = select_next_unit(units, current_player, None)
+            continue
+        handler = exact_cmds.get(cmd) or caseless_cmds.get(low)
+        if handler is not None:
+            done = handler()
         elif low.startswith('save'):
-            parts = cmd.split()
-            if len(parts) >= 2:
-                name = parts[1].strip()
-                if name:
-                    save_dir = ensure_save_dir()
-                    path = os.path.join(save_dir, f"{name}.json")
-                    players_data = [
-                        {"name": p1.name, "is_ai": p1.is_ai, "cities": list(p1.cities)},
-                        {"name": p2.name, "is_ai": p2.is_ai, "cities": list(p2.cities)},
-                    ]
-                    save_full_game(path, world, units, players_data, turn_number, current_player)
+            done = on_save(cmd)
         elif low.startswith('load'):
-            parts = cmd.split()
-            if len(parts) >= 2:
-                name = parts[1].strip()
-                if name:
-                    save_dir = ensure_save_dir()
-                    path = os.path.join(save_dir, f"{name}.json")
-                    data = load_full_game(path)
-                    loaded_map = data["map"]
-                    world.width = loaded_map["width"]
-                    world.height = loaded_map["height"]
-                    world.tiles = loaded_map["tiles"]
-                    world.fog = loaded_map["fog"]
-                    world.cities = [City(**c) for c in loaded_map["cities"]]
-                    world.explored = loaded_map.get("explored", {})
-                    units.clear()
-                    for ud in data["units"]:
-                        utype = ud.get("unit_type", "Army")
-                        if utype == "Fighter":
-                            u = Fighter(x=ud["x"], y=ud["y"], owner=ud["owner"]) 
-                        elif utype == "Carrier":
-                            u = Carrier(x=ud["x"], y=ud["y"], owner=ud["owner"]) 
-                        elif utype == "NuclearMissile":
-                            u = NuclearMissile(x=ud["x"], y=ud["y"], owner=ud["owner"]) 
-                        else:
-                            u = Army(x=ud["x"], y=ud["y"], owner=ud["owner"]) 
-                        u.symbol = ud.get("symbol", u.symbol)
-                        u.max_hp = ud.get("max_hp", u.max_hp)
-                        u.hp = ud.get("hp", u.hp)
-                        u.movement_points = ud.get("movement_points", u.movement_points)
-                        u.fuel = ud.get("fuel", None)
-                        u.moves_left = ud.get("moves_left", u.movement_points)
-                        u.home_city = tuple(ud["home_city"]) if ud.get("home_city") else None
-                        units.append(u)
-                    pdat = data.get("players", [])
-                    if len(pdat) >= 2:
-                        p1.name = pdat[0].get("name", p1.name)
-                        p1.is_ai = pdat[0].get("is_ai", False)
-                        p1.cities = set(tuple(t) for t in pdat[0].get("cities", list(p1.cities)))
-                        p2.name = pdat[1].get("name", p2.name)
-                        p2.is_ai = pdat[1].get("is_ai", False)
-                        p2.cities = set(tuple(t) for t in pdat[1].get("cities", list(p2.cities)))
-                    turn_number = data.get("turn_number", turn_number)
-                    current_player = data.get("current_player", current_player)
-                    world.init_fow([p1.name, p2.name])
-                    if isinstance(world.explored, dict):
-                        world.visible = {p1.name: [[False for _ in range(world.width)] for _ in range(world.height)], p2.name: [[False for _ in range(world.width)] for _ in range(world.height)]}
-                    recompute_visibility(world, current_player, units)
-                    sel = select_next_unit(units, current_player, None)
-                    if sel is not None:
-                        vx, vy = center_view_on(world, vw, vh, sel.x, sel.y)
-            else:
-                # List available saves
-                save_dir = ensure_save_dir()
-                saves = [fn[:-5] for fn in os.listdir(save_dir) if fn.lower().endswith('.json')]
-                print("Available saves:", ", ".join(sorted(saves)) if saves else "(none)")
+            done = on_load(cmd)
+        else:
+            done = False
+        if done:
+            break
         print("\n" * 1)
 
 
@@ -1,37 +1,106 @@
 from __future__ import annotations
 
+import base64
+import gzip
 import json
-from dataclasses import asdict
-from typing import Any, Dict, List, Tuple
+from dataclasses import fields
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Tuple
 
 from map import City, GameMap
 from units import Unit
 
+try:
+    import orjson  # type: ignore
+    HAS_ORJSON = True
+except Exception:
+    orjson = None  # type: ignore
+    HAS_ORJSON = False
+
+
+# Saves are gzip-compressed JSON; plain JSON (older saves, compress=False) loads too
+_GZIP_MAGIC = b"\x1f\x8b"
+
 
 def serialize_map(game_map: GameMap) -> Dict[str, Any]:
+    w = game_map.width
+    tiles = game_map.tiles.decode("latin-1")
     return {
-        "width": game_map.width,
+        "width": w,
         "height": game_map.height,
-        "tiles": game_map.tiles,
-        "fog": game_map.fog,
-        "cities": [asdict(c) for c in game_map.cities],
-        "explored": game_map.explored,
+        # One string per row; set_tile_rows reads these and the older per-tile lists
+        "tiles": [tiles[y * w:(y + 1) * w] for y in range(game_map.height)],
+        "fog": game_map.fog_rows(),
+        "cities": [_record(c) for c in game_map.cities],
+        "explored": encode_explored(game_map.explored),
     }
 
 
 def deserialize_map(data: Dict[str, Any]) -> GameMap:
     m = GameMap(data["width"], data["height"])
-    m.tiles = data["tiles"]
-    m.fog = data["fog"]
+    m.set_tile_rows(data["tiles"])
+    m.set_fog_rows(data["fog"])
     m.cities = [City(**c) for c in data["cities"]]
-    m.explored = data.get("explored", {})
+    m.rebuild_city_grid()
+    m.explored = decode_explored(data.get("explored", {}), m.width, m.height)
     return m
 
 
+# 0/1 cell bytes <-> ASCII '0'/'1' digits, for packing through int(..., 2)
+_CELL_TO_DIGIT = bytes.maketrans(b"\x00\x01", b"01")
+_DIGIT_TO_CELL = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def encode_explored(explored: Dict[str, bytearray]) -> Dict[str, str]:
+    # One bit per tile, row-major, packed MSB-first and base64'd: a few percent of the JSON
+    # size of nested true/false lists and far cheaper to parse on load
+    out: Dict[str, str] = {}
+    for player, cells in explored.items():
+        bits = cells.translate(_CELL_TO_DIGIT) + b"0" * (-len(cells) % 8)
+        raw = int(bits, 2).to_bytes(len(bits) // 8, "big") if bits else b""
+        out[player] = base64.b64encode(raw).decode("ascii")
+    return out
+
+
+def decode_explored(data: Dict[str, Any], width: int, height: int) -> Dict[str, bytearray]:
+    # Inverse of encode_explored; older saves stored nested true/false lists
+    out: Dict[str, bytearray] = {}
+    n = width * height
+    for player, packed in data.items():
+        if not isinstance(packed, str):
+            out[player] = bytearray(1 if v else 0 for row in packed for v in row)
+            continue
+        raw = base64.b64decode(packed)
+        bits = bin(int.from_bytes(raw, "big"))[2:].zfill(len(raw) * 8) if raw else ""
+        out[player] = bytearray(bits[:n].encode("ascii").translate(_DIGIT_TO_CELL))
+    return out
+
+
+# Per class: the attribute names a save records and one getter fetching them all
+_RECORD_LAYOUT: Dict[type, Tuple[Tuple[str, ...], Callable[[Any], Tuple[Any, ...]]]] = {}
+
+
+def _record(obj: Any) -> Dict[str, Any]:
+    # Flat dict of a city's or unit's dataclass fields, then per-class extras such as a
+    # missile's direction lock, which live in subclass __slots__ (units have no __dict__
+    # on Python 3.10+). Unlike asdict() nothing is deep-copied; the layout is built once
+    # per class
+    cls = type(obj)
+    layout = _RECORD_LAYOUT.get(cls)
+    if layout is None:
+        names = [f.name for f in fields(cls)]
+        for klass in cls.__mro__:
+            names.extend(n for n in vars(klass).get("__slots__", ()) if n not in names)
+        layout = _RECORD_LAYOUT[cls] = (tuple(names), attrgetter(*names))
+    names, get = layout
+    values = get(obj)
+    return dict(zip(names, values if len(names) > 1 else (values,)))
+
+
 def serialize_units(units: List[Unit]) -> List[Dict[str, Any]]:
     payload: List[Dict[str, Any]] = []
     for unit in units:
-        d = dict(unit.__dict__)
+        d = _record(unit)
         # include explicit unit type for robust deserialization
         d["unit_type"] = type(unit).__name__
         # Ensure tuples become lists for JSON compatibility where needed
@@ -50,7 +119,14 @@ def deserialize_players(players_data: List[Dict[str, Any]]) -> List[Dict[str, An
     return players_data
 
 
-def save_full_game(path: str, game_map: GameMap, units: List[Unit], players: List[Dict[str, Any]], turn_number: int, current_player: str) -> None:
+def _json_default(obj: Any) -> Any:
+    # Sets (e.g. player city coordinates) are written as sorted lists
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def save_full_game(path: str, game_map: GameMap, units: List[Unit], players: List[Dict[str, Any]], turn_number: int, current_player: str, compress: bool = True) -> None:
     payload = {
         "map": serialize_map(game_map),
         "units": serialize_units(units),
@@ -58,13 +134,26 @@ def save_full_game(path: str, game_map: GameMap, units: List[Unit], players: Lis
         "turn_number": turn_number,
         "current_player": current_player,
     }
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f)
+    # Same JSON either way; orjson, when installed, encodes it several times faster
+    if HAS_ORJSON:
+        raw = orjson.dumps(payload, default=_json_default)
+    else:
+        raw = json.dumps(payload, default=_json_default).encode("utf-8")
+    # The grids are long repetitive runs, so even the fastest gzip level shrinks a save
+    # ~30x; compress=False writes readable JSON for debugging. mtime=0 keeps output stable
+    if compress:
+        raw = gzip.compress(raw, compresslevel=1, mtime=0)
+    with open(path, "wb") as f:
+        f.write(raw)
 
 
 def load_full_game(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return data
+    with open(path, "rb") as f:
+        raw = f.read()
+    if raw[:2] == _GZIP_MAGIC:
+        raw = gzip.decompress(raw)
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
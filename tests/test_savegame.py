@@ -0,0 +1,52 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+from savegame import load_full_game, save_full_game  # noqa: E402
+
+
+def _players_data(p1, p2):
+    return [
+        {"name": p1.name, "is_ai": p1.is_ai, "cities": p1.cities},
+        {"name": p2.name, "is_ai": p2.is_ai, "cities": p2.cities},
+    ]
+
+
+class SaveLoadRoundTripTest(unittest.TestCase):
+    def test_explored_tiles_survive_save_and_load(self):
+        world, p1, p2, units = main.build_initial_game(width=40, height=20)
+        main.init_game_stats([p1.name, p2.name])
+        main.rebuild_unit_roster(units)
+        world.init_fow([p1.name, p2.name])
+        # Explore the corner farthest from P1's units and cities, outside their
+        # sight, so only the save can account for it being explored after a load
+        seers = [(u.x, u.y) for u in units if u.owner == p1.name]
+        seers += [(c.x, c.y) for c in world.cities if c.owner == p1.name]
+        cx, cy = max(((1, 1), (38, 1), (1, 18), (38, 18)),
+                     key=lambda t: min(abs(t[0] - x) + abs(t[1] - y) for x, y in seers))
+        world.mark_visible_circle(p1.name, cx, cy, 1)
+        saved = {p: bytes(grid) for p, grid in world.explored.items()}
+        self.assertTrue(any(saved[p1.name]))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "rt.json")
+            save_full_game(path, world, units, _players_data(p1, p2), 3, p1.name)
+            data = load_full_game(path)
+
+        world2, q1, q2, units2 = main.build_initial_game(width=40, height=20)
+        turn, current = main.restore_game(world2, units2, q1, q2, data, 1, q2.name)
+
+        self.assertEqual((turn, current), (3, p1.name))
+        for p, grid in saved.items():
+            restored = world2.explored[p]
+            # Everything explored at save time is still explored after the load
+            self.assertTrue(all(r for s, r in zip(grid, restored) if s), p)
+        self.assertEqual(world2.tiles, world.tiles)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import Optional, Tuple
 
+# Slotted dataclasses (no per-instance __dict__: smaller objects, faster attribute
+# access) need Python 3.10+; on 3.9 units fall back to ordinary instances
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Unit:
     x: int
     y: int
@@ -29,29 +34,39 @@ class Unit:
 
 
 class Army(Unit):
+    __slots__ = ()
+
     def __init__(self, x: int, y: int, owner: str) -> None:
         super().__init__(x=x, y=y, owner=owner, symbol='A', max_hp=10, hp=10, movement_points=1)
 
 
 # Placeholders for future units (Sprint 2)
 class Destroyer(Unit):
+    __slots__ = ()
+
     def __init__(self, x: int, y: int, owner: str) -> None:
         super().__init__(x=x, y=y, owner=owner, symbol='D', max_hp=12, hp=12, movement_points=3)
 
 
 class Fighter(Unit):
+    __slots__ = ()
+
     def __init__(self, x: int, y: int, owner: str) -> None:
         # 12 move per turn; no persistent fuel tracking (basing rule handled in main loop)
         super().__init__(x=x, y=y, owner=owner, symbol='F', max_hp=8, hp=8, movement_points=12, fuel=None)
 
 
 class Carrier(Unit):
+    __slots__ = ()
+
     def __init__(self, x: int, y: int, owner: str) -> None:
         # Slow, sturdy sea unit; 3 move, cannot enter land
         super().__init__(x=x, y=y, owner=owner, symbol='C', max_hp=16, hp=16, movement_points=3)
 
 
 class NuclearMissile(Unit):
+    __slots__ = ("direction_dx", "direction_dy", "traveled")
+
     def __init__(self, x: int, y: int, owner: str) -> None:
         # One-turn strategic weapon: up to 40 tiles straight-line, detonates on command or at max range
         super().__init__(x=x, y=y, owner=owner, symbol='M', max_hp=1, hp=1, movement_points=40)